@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Compare the adaptive natural-run merge sort with mergeSort on presorted inputs
+"""
+
+import os
+import statistics
+import sys
+import time
+
+# Add parent directory to path to import sorting modules
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(REPO_ROOT)
+
+from merge.merge import mergeSort
+from merge.natural_merge import natural_merge_sort
+from test_data_generator import make_input
+
+BENCHMARK_ITERATIONS = 3
+MS_PER_SEC = 1_000
+
+# TEST_SIZES = [10**6, 10**7]
+TEST_SIZES = [10**5]
+INPUT_KINDS = ["sorted", "reverse", "nearly_sorted", "random"]
+
+def time_sort(sort_func, data):
+    times = []
+    for _ in range(BENCHMARK_ITERATIONS):
+        test_data = list(data)
+        start_time = time.perf_counter()
+        sort_func(test_data, 0, len(test_data) - 1)
+        times.append(time.perf_counter() - start_time)
+        assert test_data == sorted(data)
+    return statistics.mean(times) * MS_PER_SEC
+
+def main():
+    print("Adaptive Merge Sort Benchmark")
+    print("=" * 60)
+
+    for size in TEST_SIZES:
+        print(f"\n--- Size: {size} ---")
+        for kind in INPUT_KINDS:
+            data = make_input(kind, size)
+            natural_ms = time_sort(natural_merge_sort, data)
+            merge_ms = time_sort(mergeSort, data)
+            print(f"{kind:>14}: natural_merge: {natural_ms:.3f} ms  "
+                  f"merge_serial: {merge_ms:.3f} ms  "
+                  f"Speedup: {merge_ms / natural_ms:.2f}x")
+
+    print("\nBenchmark completed!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Compare serial bubble sort modes (passes and time) on nearly-sorted inputs
+"""
+
+import os
+import statistics
+import sys
+import time
+
+# Add parent directory to path to import sorting modules
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(REPO_ROOT)
+
+from bubble.bubble import BUBBLE_MODES, bubble_sort
+from test_data_generator import make_input
+
+BENCHMARK_ITERATIONS = 3
+MS_PER_SEC = 1_000
+
+# TEST_SIZES = [10**4, 10**5]
+TEST_SIZES = [2_000]
+INPUT_KINDS = ["nearly_sorted", "sorted", "reverse", "random"]
+
+def time_mode(mode, data):
+    times = []
+    for _ in range(BENCHMARK_ITERATIONS):
+        test_data = list(data)
+        start_time = time.perf_counter()
+        passes = bubble_sort(test_data, mode)
+        times.append(time.perf_counter() - start_time)
+        assert test_data == sorted(data)
+    return passes, statistics.mean(times) * MS_PER_SEC
+
+def main():
+    print("Bubble Sort Mode Benchmark")
+    print("=" * 60)
+
+    for size in TEST_SIZES:
+        print(f"\n--- Size: {size} ---")
+        for kind in INPUT_KINDS:
+            data = make_input(kind, size)
+            print(f"{kind}:")
+            for mode in BUBBLE_MODES:
+                passes, ms = time_mode(mode, data)
+                print(f"  {mode:>8}: {passes:>6} passes  {ms:.3f} ms")
+
+    print("\nBenchmark completed!")
+
+if __name__ == "__main__":
+    main()
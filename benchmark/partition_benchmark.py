@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Compare quicksort partition schemes on duplicate-heavy (few unique) inputs
+"""
+
+import os
+import statistics
+import sys
+import time
+
+# Add parent directory to path to import sorting modules
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(REPO_ROOT)
+
+from quick.quick import PARTITION_SCHEMES, introsort
+from quick.quick_parallel import quicksort_parallel_shared
+from test_data_generator import make_input
+
+BENCHMARK_ITERATIONS = 3
+MS_PER_SEC = 1_000
+PARALLEL_WORKERS = 4
+
+# TEST_SIZES = [10**6, 10**7]
+TEST_SIZES = [10**5]
+INPUT_KINDS = ["few_unique", "random"]
+
+def time_sort(sort_func, data):
+    times = []
+    for _ in range(BENCHMARK_ITERATIONS):
+        test_data = list(data)
+        start_time = time.perf_counter()
+        sort_func(test_data)
+        times.append(time.perf_counter() - start_time)
+        assert test_data == sorted(data)
+    return statistics.mean(times) * MS_PER_SEC
+
+def main():
+    print("Quicksort Partition Scheme Benchmark")
+    print("=" * 60)
+
+    for size in TEST_SIZES:
+        print(f"\n--- Size: {size} ---")
+        for kind in INPUT_KINDS:
+            data = make_input(kind, size)
+            print(f"{kind}:")
+            baseline = None
+            for scheme in PARTITION_SCHEMES:
+                serial_ms = time_sort(lambda a: introsort(a, scheme=scheme), data)
+                parallel_ms = time_sort(
+                    lambda a: quicksort_parallel_shared(a, PARALLEL_WORKERS, scheme=scheme), data)
+                baseline = baseline or serial_ms
+                print(f"  {scheme:>10}: introsort: {serial_ms:.3f} ms "
+                      f"({baseline / serial_ms:.2f}x vs lomuto)  "
+                      f"quick_parallel_shared: {parallel_ms:.3f} ms")
+
+    print("\nBenchmark completed!")
+
+if __name__ == "__main__":
+    main()
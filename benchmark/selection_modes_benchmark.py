@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Compare classic and double-ended selection sort, serial and parallel
+"""
+
+import os
+import statistics
+import sys
+import time
+
+# Add parent directory to path to import sorting modules
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(REPO_ROOT)
+
+from selection.selection import SELECTION_MODES, selection_sort
+from selection.selection_parallel import selection_sort_parallel
+from test_data_generator import make_input
+
+BENCHMARK_ITERATIONS = 3
+MS_PER_SEC = 1_000
+PARALLEL_WORKERS = 4
+
+# TEST_SIZES = [10**4, 2 * 10**4]
+TEST_SIZES = [2_000, 5_000]
+INPUT_KINDS = ["random", "reverse", "few_unique"]
+
+def time_sort(sort_func, data):
+    times = []
+    for _ in range(BENCHMARK_ITERATIONS):
+        test_data = list(data)
+        start_time = time.perf_counter()
+        sort_func(test_data)
+        times.append(time.perf_counter() - start_time)
+        assert test_data == sorted(data)
+    return statistics.mean(times) * MS_PER_SEC
+
+def main():
+    print("Selection Sort Mode Benchmark")
+    print("=" * 60)
+
+    for size in TEST_SIZES:
+        print(f"\n--- Size: {size} ---")
+        for kind in INPUT_KINDS:
+            data = make_input(kind, size)
+            print(f"{kind}:")
+            for mode in SELECTION_MODES:
+                serial_ms = time_sort(lambda a: selection_sort(a, mode), data)
+                parallel_ms = time_sort(
+                    lambda a: selection_sort_parallel(a, PARALLEL_WORKERS, mode), data)
+                print(f"  {mode:>8}: serial {serial_ms:10.3f} ms  "
+                      f"parallel ({PARALLEL_WORKERS} workers) {parallel_ms:10.3f} ms")
+
+    print("\nBenchmark completed!")
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,45 @@ Generate test datasets for benchmarks (JSON for Python; TXT for Julia/C++).
 import json
 import os
 import random
+from array import array
 
 # SIZES = [10**7, 10**8]
 SIZES = [10**4]
 NUM_DATASETS_PER_SIZE = 3  # Generate 3 different datasets per size
 SEED = 42
 
+# Sizes written only as binary int64 files for merge/external_merge_sort.py;
+# these are streamed to disk and never held in memory as lists
+# BINARY_SIZES = [10**8, 10**9]
+BINARY_SIZES = []
+BINARY_BLOCK = 1 << 20
+
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 TEST_DATA_DIR = os.path.join(ROOT, "test_data")
 
+def make_input(kind, n, seed=SEED):
+    """Build an in-memory input of a given shape for the shape benchmarks.
+
+    kind is one of "random", "sorted", "reverse", "nearly_sorted"
+    (1% of positions swapped) or "few_unique" (keys drawn from 0..9).
+    """
+    rng = random.Random(seed)
+    if kind == "random":
+        return [rng.randint(0, 1_000_000) for _ in range(n)]
+    if kind == "sorted":
+        return sorted(rng.randint(0, 1_000_000) for _ in range(n))
+    if kind == "reverse":
+        return sorted((rng.randint(0, 1_000_000) for _ in range(n)), reverse=True)
+    if kind == "nearly_sorted":
+        data = sorted(rng.randint(0, 1_000_000) for _ in range(n))
+        for _ in range(max(1, n // 100) if n > 1 else 0):
+            i, j = rng.randrange(n), rng.randrange(n)
+            data[i], data[j] = data[j], data[i]
+        return data
+    if kind == "few_unique":
+        return [rng.randint(0, 9) for _ in range(n)]
+    raise ValueError(f"unknown input kind: {kind!r}")
+
 def main():
     os.makedirs(TEST_DATA_DIR, exist_ok=True)
 
@@ -45,6 +75,15 @@ def main():
         with open(txt_path, "w") as f:
             f.write(" ".join(map(str, data)))
 
+    # Binary int64 datasets for the external sort, written block by block
+    for n in BINARY_SIZES:
+        random.seed(SEED)
+        bin_path = os.path.join(TEST_DATA_DIR, f"data_{n}.bin")
+        with open(bin_path, "wb") as f:
+            for start in range(0, n, BINARY_BLOCK):
+                count = min(BINARY_BLOCK, n - start)
+                array("q", (random.randint(0, 1_000_000) for _ in range(count))).tofile(f)
+
     # Write JSON for Python benchmark compatibility
     json_path = os.path.join(TEST_DATA_DIR, "test_datasets.json")
     with open(json_path, "w") as f:
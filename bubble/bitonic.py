@@ -0,0 +1,140 @@
+import multiprocessing
+import os
+import sys
+from multiprocessing import shared_memory
+
+import numpy as np
+
+try:
+    from common.shared import join_workers, key_typecode
+except ImportError:  # run as a script from inside bubble/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.shared import join_workers, key_typecode
+
+
+def _padded(arr, dtype=None):
+    # Copy arr into an array (of its own dtype unless given) padded with
+    # its maximum up to a power of two
+    a = np.asarray(arr, dtype=dtype)
+    size = 1 << max(0, (len(a) - 1).bit_length())
+    padded = np.full(size, a.max(), dtype=a.dtype)
+    padded[:len(a)] = a
+    return padded
+
+
+def _stages(size):
+    # The (k, j) stages of a bitonic network on size elements: pairs are
+    # (i, i + j) and blocks of k alternate ascending and descending
+    k = 2
+    while k <= size:
+        j = k // 2
+        while j >= 1:
+            yield k, j
+            j //= 2
+        k *= 2
+
+
+def _compare_exchange(a, k, j, rows=slice(None), cols=slice(None)):
+    # Vectorized compare-exchange of one stage on the selected rows/columns
+    # of the (size / 2j, 2, j) view, where [:, 0] and [:, 1] are the pairs
+    view = a.reshape(-1, 2, j)
+    lo = view[rows, 0, cols]
+    hi = view[rows, 1, cols]
+    first = np.arange(view.shape[0])[rows] * 2 * j
+    ascending = ((first & k) == 0)[:, None]
+    low = np.minimum(lo, hi)
+    high = np.maximum(lo, hi)
+    view[rows, 0, cols] = np.where(ascending, low, high)
+    view[rows, 1, cols] = np.where(ascending, high, low)
+
+
+def bitonic_sort(arr):
+    # Bitonic sorting network with every stage as one vectorized
+    # compare-exchange; the comparison pattern does not depend on the data
+    n = len(arr)
+    if n <= 1:
+        return arr
+    a = _padded(arr)
+    for k, j in _stages(len(a)):
+        _compare_exchange(a, k, j)
+    arr[:] = a[:n].tolist()
+    return arr
+
+
+def _stage_slices(size, j, w, workers):
+    # Worker w's share of a stage: a band of rows, or a band of columns
+    # when there are fewer rows than workers
+    rows = size // (2 * j)
+    if rows >= workers:
+        return slice(rows * w // workers, rows * (w + 1) // workers), slice(None)
+    return slice(None), slice(j * w // workers, j * (w + 1) // workers)
+
+
+def _bitonic_worker(name, size, w, workers, barrier):
+    shm = shared_memory.SharedMemory(name=name)
+    a = np.ndarray((size,), dtype=np.int64, buffer=shm.buf)
+    try:
+        for k, j in _stages(size):
+            rows, cols = _stage_slices(size, j, w, workers)
+            _compare_exchange(a, k, j, rows, cols)
+            barrier.wait()
+    finally:
+        del a
+        shm.close()
+
+
+def bitonic_sort_parallel(arr, max_workers=4):
+    # Shared-memory multi-process bitonic sort of integer keys: every
+    # stage is split evenly across persistent workers, with a barrier
+    # between stages. The shared buffer is int64.
+    n = len(arr)
+    if n <= 1:
+        return arr
+    if key_typecode(arr) != "q":
+        raise TypeError("bitonic_sort_parallel needs integer keys that fit in int64")
+    padded = _padded(arr, np.int64)
+    size = len(padded)
+    workers = max(1, min(max_workers, size // 2))
+
+    shm = shared_memory.SharedMemory(create=True, size=size * 8)
+    a = np.ndarray((size,), dtype=np.int64, buffer=shm.buf)
+    try:
+        a[:] = padded
+        barrier = multiprocessing.Barrier(workers)
+        procs = [
+            multiprocessing.Process(target=_bitonic_worker, args=(shm.name, size, w, workers, barrier))
+            for w in range(workers)
+        ]
+        for p in procs:
+            p.start()
+        join_workers(procs, barrier)
+        if any(p.exitcode != 0 for p in procs):
+            raise RuntimeError("bitonic worker failed")
+        arr[:] = a[:n].tolist()
+    finally:
+        del a
+        shm.close()
+        shm.unlink()
+    return arr
+
+
+def print_array(arr):
+    for v in arr:
+        print(v, end=" ")
+    print()
+
+
+if __name__ == "__main__":
+    data = [64, 34, 25, 12, 22, 11, 90, 5, 3, 8, 7, 2]
+    print("Original array: ", end="")
+    print_array(data)
+    bitonic_sort(data)
+    print("Sorted array: ", end="")
+    print_array(data)
+    assert data == sorted(data)
+
+    data = [64, 34, 25, 12, 22, 11, 90, 5, 3, 8, 7, 2]
+    bitonic_sort_parallel(data, max_workers=4)
+    print("Sorted array (parallel): ", end="")
+    print_array(data)
+    assert data == sorted(data)
@@ -1,13 +1,92 @@
-def bubble_sort(arr):
+BUBBLE_MODES = ("classic", "bounded", "cocktail", "comb")
+COMB_SHRINK = 1.3
+
+
+def _bubble_classic(arr):
     n = len(arr)
+    passes = 0
     for i in range(n):
         swapped = False
         for j in range(0, n - i - 1):
             if arr[j] > arr[j + 1]:
                 arr[j], arr[j + 1] = arr[j + 1], arr[j]
                 swapped = True
+        passes += 1
         if not swapped:
             break
+    return passes
+
+
+def _bubble_bounded(arr):
+    # Everything after the last swap of a pass is already in place
+    bound = len(arr) - 1
+    passes = 0
+    while bound > 0:
+        last = 0
+        for j in range(bound):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                last = j
+        passes += 1
+        bound = last
+    return passes
+
+
+def _bubble_cocktail(arr):
+    # Alternate forward and backward passes so small elements ("turtles")
+    # also move many steps per pass; both ends shrink to the last swap
+    lo, hi = 0, len(arr) - 1
+    passes = 0
+    while lo < hi:
+        last = lo
+        for j in range(lo, hi):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                last = j
+        hi = last
+        passes += 1
+        if lo >= hi:
+            break
+
+        last = hi
+        for j in range(hi - 1, lo - 1, -1):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+                last = j + 1
+        lo = last
+        passes += 1
+    return passes
+
+
+def _bubble_comb(arr):
+    # Compare elements gap apart, shrinking the gap by 1.3 per pass,
+    # then finish with plain bubble passes at gap 1
+    n = len(arr)
+    gap = n
+    passes = 0
+    swapped = True
+    while gap > 1 or swapped:
+        gap = max(1, int(gap / COMB_SHRINK))
+        swapped = False
+        for i in range(n - gap):
+            if arr[i] > arr[i + gap]:
+                arr[i], arr[i + gap] = arr[i + gap], arr[i]
+                swapped = True
+        passes += 1
+    return passes
+
+
+def bubble_sort(arr, mode="classic"):
+    # Sorts arr in place and returns the number of passes made
+    if mode == "classic":
+        return _bubble_classic(arr)
+    if mode == "bounded":
+        return _bubble_bounded(arr)
+    if mode == "cocktail":
+        return _bubble_cocktail(arr)
+    if mode == "comb":
+        return _bubble_comb(arr)
+    raise ValueError(f"unknown mode: {mode!r}")
 
 def print_array(arr):
     for val in arr:
@@ -22,4 +101,10 @@ if __name__ == "__main__":
     print("Sorted array: ", end="")
     print_array(arr)
 
+    for mode in BUBBLE_MODES:
+        arr = [64, 34, 25, 12, 22, 11, 90]
+        passes = bubble_sort(arr, mode)
+        assert arr == sorted(arr)
+        print(f"{mode}: {passes} passes")
+
 
@@ -0,0 +1,90 @@
+import numpy as np
+
+
+def _phase(a, start):
+    # One odd or even phase: all pairs (i, i + 1) with i = start, start + 2, ...
+    # as whole-array minimum/maximum over two strided views
+    n = len(a)
+    left = a[start:n - 1:2]
+    right = a[start + 1:n:2]
+    if not (left > right).any():
+        return False
+    low = np.minimum(left, right)
+    high = np.maximum(left, right)
+    left[:] = low
+    right[:] = high
+    return True
+
+
+def odd_even_sort_numpy(arr):
+    # Vectorized odd-even transposition sort; stops as soon as a full
+    # round (even + odd phase) changes nothing
+    a = np.array(arr)
+    if len(a) > 1:
+        swapped = True
+        while swapped:
+            swapped = _phase(a, 0)
+            swapped |= _phase(a, 1)
+    arr[:] = a.tolist()
+    return arr
+
+
+def block_odd_even_sort_numpy(arr, blocks=4):
+    # Odd-even merge-split sort: sort p blocks locally, then run odd-even
+    # transposition over blocks, where a compare-exchange merges two
+    # neighbouring blocks and splits them into a lower and an upper half.
+    # All pairs of a phase are processed at once as rows of a 2-D array.
+    a = np.array(arr)
+    n = len(a)
+    if n <= 1:
+        return arr
+    blocks = max(1, min(blocks, n))
+    m = -(-n // blocks)
+
+    # Pad with the largest key so that every block has m elements
+    padded = np.full(blocks * m, a.max(), dtype=a.dtype)
+    padded[:n] = a
+    grid = padded.reshape(blocks, m)
+    grid.sort(axis=1)
+
+    for rnd in range(blocks):
+        swapped = False
+        for start in (0, 1):
+            pairs = (blocks - start) // 2
+            if pairs == 0:
+                continue
+            left = grid[start:start + 2 * pairs:2]
+            right = grid[start + 1:start + 2 * pairs:2]
+            if not (left[:, -1] > right[:, 0]).any():
+                continue
+            merged = np.sort(np.concatenate((left, right), axis=1), axis=1)
+            left[:] = merged[:, :m]
+            right[:] = merged[:, m:]
+            swapped = True
+        if not swapped:
+            break
+
+    arr[:] = grid.reshape(-1)[:n].tolist()
+    return arr
+
+
+def print_array(arr):
+    for v in arr:
+        print(v, end=" ")
+    print()
+
+
+if __name__ == "__main__":
+    data = [64, 34, 25, 12, 22, 11, 90, 5, 3, 8, 7, 2]
+    print("Original array: ", end="")
+    print_array(data)
+    odd_even_sort_numpy(data)
+    print("Sorted array: ", end="")
+    print_array(data)
+    assert data == sorted(data)
+
+    data = [64, 34, 25, 12, 22, 11, 90, 5, 3, 8, 7, 2]
+    block_odd_even_sort_numpy(data, blocks=4)
+    print("Sorted array (blocks): ", end="")
+    print_array(data)
+    assert data == sorted(data)
@@ -1,8 +1,16 @@
-from typing import Any
-
-
+import multiprocessing
+import os
+import sys
+from array import array
 from concurrent.futures import ProcessPoolExecutor
 from itertools import repeat
+from multiprocessing import shared_memory
+
+try:
+    from common.shared import join_workers, key_typecode
+except ImportError:  # run as a script from inside bubble/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.shared import join_workers, key_typecode
 
 
 def _compare_pairs(snapshot, indices):
@@ -49,7 +57,111 @@ def _phase_parallel(arr, start, executor, max_workers):
     return True
 
 
-def bubble_sort_parallel(arr, max_workers=4):
+def _odd_even_worker(name, n, workers, w, lo, hi, barrier):
+    # Persistent odd-even transposition worker. It owns arr[lo:hi] (lo and
+    # hi even, so even-phase pairs never cross blocks) and keeps it in a
+    # local list. Per round only the block's first and last elements and a
+    # swap flag go through shared memory, followed by one barrier.
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf[:(n + 6 * workers) * 8].cast("q")
+    try:
+        block = view[lo:hi].tolist()
+        m = len(block)
+        rnd = 0
+        while True:
+            swapped = False
+            for start in (0, 1):
+                for i in range(start, m - 1, 2):
+                    if block[i] > block[i + 1]:
+                        block[i], block[i + 1] = block[i + 1], block[i]
+                        swapped = True
+
+            # Double-buffered by round parity so a slow neighbour can still
+            # read the previous round's edges
+            edges = n + (rnd % 2) * 2 * workers
+            flags = n + 4 * workers + (rnd % 2) * workers
+            view[edges + 2 * w] = block[0]
+            view[edges + 2 * w + 1] = block[-1]
+            view[flags + w] = swapped
+            barrier.wait()
+
+            # Odd-phase pairs across block boundaries: left keeps the min,
+            # right keeps the max. Every worker evaluates all of them so that
+            # they agree on when to stop.
+            if w > 0:
+                block[0] = max(block[0], view[edges + 2 * w - 1])
+            if w < workers - 1:
+                block[-1] = min(block[-1], view[edges + 2 * w + 2])
+            done = not any(view[flags:flags + workers]) and all(
+                view[edges + 2 * v + 1] <= view[edges + 2 * v + 2] for v in range(workers - 1)
+            )
+            if done:
+                break
+            rnd += 1
+
+        view[lo:hi] = array("q", block)
+    finally:
+        view.release()
+        shm.close()
+
+
+def bubble_sort_parallel_shared(arr, max_workers=4):
+    # Odd-even transposition sort of integer keys over a shared-memory
+    # array. Workers attach once and each owns a fixed block; there is no
+    # per-phase data transfer beyond block edges.
+    n = len(arr)
+    if n <= 1:
+        return arr
+    workers = max(1, min(max_workers, n // 2))
+    bounds = [(n * w // workers) & ~1 for w in range(workers)] + [n]
+
+    size = (n + 6 * workers) * 8
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    view = shm.buf[:size].cast("q")
+    try:
+        view[:n] = array("q", arr)
+        barrier = multiprocessing.Barrier(workers)
+        procs = [
+            multiprocessing.Process(
+                target=_odd_even_worker,
+                args=(shm.name, n, workers, w, bounds[w], bounds[w + 1], barrier),
+            )
+            for w in range(workers)
+        ]
+        for p in procs:
+            p.start()
+        join_workers(procs, barrier)
+        if any(p.exitcode != 0 for p in procs):
+            raise RuntimeError("odd-even transposition worker failed")
+        arr[:] = view[:n].tolist()
+    finally:
+        view.release()
+        shm.close()
+        shm.unlink()
+    return arr
+
+
+def bubble_sort_parallel(arr, max_workers=4, backend="shared"):
+    # backend="shared": persistent workers over shared memory;
+    # backend="snapshot": per-phase snapshots compared in a process pool;
+    # backend="numpy" / "numpy_block": vectorized phases (needs NumPy),
+    # the latter as merge-split steps between max_workers sorted blocks.
+    # Keys that are not int64 integers use "snapshot" instead of "shared".
+    if backend == "shared" and key_typecode(arr) != "q":
+        backend = "snapshot"
+    if backend == "shared":
+        return bubble_sort_parallel_shared(arr, max_workers)
+    if backend in ("numpy", "numpy_block"):
+        try:
+            from bubble.bubble_numpy import block_odd_even_sort_numpy, odd_even_sort_numpy
+        except ImportError:  # run as a script from inside bubble/
+            from bubble_numpy import block_odd_even_sort_numpy, odd_even_sort_numpy
+        if backend == "numpy":
+            return odd_even_sort_numpy(arr)
+        return block_odd_even_sort_numpy(arr, max_workers)
+    if backend != "snapshot":
+        raise ValueError(f"unknown backend: {backend!r}")
+
     n = len(arr)
     if n <= 1:
         return arr
@@ -78,4 +190,8 @@ if __name__ == "__main__":
     print_array(data)
     assert data == sorted(data)
 
+    data = [64, 34, 25, 12, 22, 11, 90, 5, 3, 8, 7, 2]
+    bubble_sort_parallel(data, max_workers=4, backend="snapshot")
+    assert data == sorted(data)
+
 
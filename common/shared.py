@@ -0,0 +1,58 @@
+# Helpers shared by the multi-process sorts: the key check that picks a
+# shared buffer's type, the pool initializer that maps the buffer into
+# every worker, and the join of persistent Process + Barrier workers
+
+from array import array
+from multiprocessing import shared_memory
+from multiprocessing.connection import wait
+from numbers import Integral
+
+# Shared buffer of a worker pool, attached once per worker by attach_shared.
+# Tasks read and write buf; n is the length of the input it holds.
+shm = None
+buf = None
+n = 0
+
+
+def key_typecode(values):
+    # Typecode of a shared buffer that holds values exactly: "q" if every
+    # key is an int that fits int64, "d" if every key is a float, None
+    # otherwise. NumPy arrays are judged by their dtype; NumPy integer
+    # scalars count as ints.
+    dtype = getattr(values, "dtype", None)
+    if dtype is not None and dtype.kind != "O":
+        if dtype.kind == "i" or (dtype.kind == "u" and dtype.itemsize < 8):
+            return "q"
+        if dtype.kind == "f" and dtype.itemsize <= 8:
+            return "d"
+        return None
+    if all((isinstance(x, int) or isinstance(x, Integral)) and -(1 << 63) <= x < (1 << 63)
+           for x in values):
+        return "q"
+    if all(isinstance(x, float) for x in values):
+        return "d"
+    return None
+
+
+def attach_shared(name, size, typecode="q", slots=None):
+    # Pool initializer: map slots items (size unless given, e.g. 2 * size
+    # for an input half and an output half) of the named shared memory
+    # into this worker as buf, with the given typecode
+    global shm, buf, n
+    shm = shared_memory.SharedMemory(name=name)
+    slots = size if slots is None else slots
+    buf = shm.buf[:slots * array(typecode).itemsize].cast(typecode)
+    n = size
+
+
+def join_workers(procs, barrier):
+    # Wait for every worker. If one exits abnormally, break the barrier so
+    # that nobody, the parent included, waits for it forever.
+    pending = list(procs)
+    while pending:
+        ready = wait([p.sentinel for p in pending])
+        for p in [p for p in pending if p.sentinel in ready]:
+            p.join()
+            pending.remove(p)
+            if p.exitcode != 0:
+                barrier.abort()
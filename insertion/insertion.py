@@ -1,6 +1,14 @@
 # from https://www.geeksforgeeks.org/insertion-sort/
 
-def insertionSort(arr):
+from bisect import bisect_right
+
+def insertionSort(arr, mode="linear"):
+    if mode == "binary":
+        binaryInsertionSort(arr)
+        return
+    if mode != "linear":
+        raise ValueError(f"unknown mode: {mode!r}")
+
     for i in range(1, len(arr)):
         key = arr[i]
         j = i - 1
@@ -13,6 +21,27 @@ def insertionSort(arr):
             j -= 1
         arr[j + 1] = key
 
+# Binary insertion sort of arr[low..high]: bisect finds the position
+# in O(log n) comparisons and the elements are shifted at C speed
+# instead of one Python assignment per element. list.pop/insert move
+# everything up to the end of arr, so they are only used when the range
+# reaches the end; otherwise a slice assignment shifts just the range.
+# bisect_right keeps equal keys in their original order.
+def binaryInsertionSort(arr, low=0, high=None):
+    if high is None:
+        high = len(arr) - 1
+    to_end = high == len(arr) - 1
+    for i in range(low + 1, high + 1):
+        key = arr[i]
+        pos = bisect_right(arr, key, low, i)
+        if pos == i:
+            continue
+        if to_end:
+            arr.insert(pos, arr.pop(i))
+        else:
+            arr[pos + 1:i + 1] = arr[pos:i]
+            arr[pos] = key
+
 def printArray(arr):
     for i in range(len(arr)):
         print(arr[i], end=" ")
@@ -22,4 +51,8 @@ def printArray(arr):
 if __name__ == "__main__":
     arr = [12, 11, 13, 5, 6]
     insertionSort(arr)
+    printArray(arr)
+
+    arr = [12, 11, 13, 5, 6]
+    insertionSort(arr, mode="binary")
     printArray(arr)
\ No newline at end of file
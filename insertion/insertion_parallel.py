@@ -139,6 +139,7 @@ Throughout generation, made point that it believed insertion sort would be diffi
 """
 
 import concurrent.futures
+import os
 
 # Merge Sort Implementation
 def merge(left, right):
@@ -157,8 +158,11 @@ def merge(left, right):
     sorted_array.extend(right[j:])
     return sorted_array
 
-def parallel_merge_sort(arr):
-    """Perform parallel merge sort."""
+def parallel_merge_sort(arr, max_workers=None):
+    """Perform parallel merge sort with at most max_workers threads
+    (default: CPU count) running at once."""
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
     
     # Base case for recursion
     if len(arr) <= 1:
@@ -169,15 +173,16 @@ def parallel_merge_sort(arr):
     left = arr[:mid]
     right = arr[mid:]
     
-    # Use ThreadPoolExecutor to sort the halves in parallel
-    with concurrent.futures.ThreadPoolExecutor() as executor:
-        # Recursively sort both halves in parallel
-        left_future = executor.submit(parallel_merge_sort, left)
-        right_future = executor.submit(parallel_merge_sort, right)
-        
-        # Wait for both halves to be sorted
+    # Worker budget used up: sort both halves in this thread
+    if max_workers < 2:
+        return merge(parallel_merge_sort(left, 1), parallel_merge_sort(right, 1))
+    
+    # Sort the left half in one new thread and the right half in this one,
+    # splitting the worker budget between them
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        left_future = executor.submit(parallel_merge_sort, left, max_workers // 2)
+        right_sorted = parallel_merge_sort(right, max_workers - max_workers // 2)
         left_sorted = left_future.result()
-        right_sorted = right_future.result()
     
     # Merge the sorted halves
     return merge(left_sorted, right_sorted)
@@ -1,7 +1,25 @@
 # Python program for parallel implementation of Insertion Sort
 import concurrent.futures
-import threading
-from typing import List
+import os
+import sys
+from array import array
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+try:
+    from insertion.insertion import binaryInsertionSort
+except ImportError:  # run as a script from inside insertion/
+    from insertion import binaryInsertionSort
+
+try:
+    from common import shared
+    from merge.kway_merge import kway_merge_into
+    from merge.merge_path import multiway_co_rank
+except ImportError:  # run as a script from inside insertion/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common import shared
+    from merge.kway_merge import kway_merge_into
+    from merge.merge_path import multiway_co_rank
 
 def insertion_sort_sequential(arr: List[int], start: int, end: int) -> None:
     """Sequential insertion sort for a subarray"""
@@ -14,8 +32,64 @@ def insertion_sort_sequential(arr: List[int], start: int, end: int) -> None:
             j -= 1
         arr[j + 1] = key
 
-def parallel_insertion_sort(arr: List[int], start: int = 0, end: int = None) -> None:
-    """Parallel insertion sort using divide and conquer approach"""
+# The chunked engine's shared buffer holds two halves of n slots:
+# sorted blocks in [0, n), merged output in [n, 2n).
+
+def _sort_block(lo: int, hi: int) -> None:
+    """Worker task: insertion sort the shared block [lo, hi)"""
+    block = shared.buf[lo:hi].tolist()
+    binaryInsertionSort(block)
+    shared.buf[lo:hi] = array("q", block)
+
+def _merge_segment(bounds: List[int], k0: int, k1: int) -> None:
+    """Worker task: write output ranks [k0, k1) of the p-way merge of the
+    sorted blocks; the worker finds its own input ranges by co-rank"""
+    runs = [shared.buf[lo:hi] for lo, hi in zip(bounds, bounds[1:])]
+    starts = multiway_co_rank(runs, k0)
+    ends = multiway_co_rank(runs, k1)
+    pieces = [run[s:e].tolist() for run, s, e in zip(runs, starts, ends)]
+    dst = shared.n + k0
+    kway_merge_into(pieces, shared.buf, dst)
+    for run in runs:
+        run.release()
+
+def chunked_insertion_sort(arr: List[int], workers: Optional[int] = None,
+                           start: int = 0, end: Optional[int] = None) -> None:
+    """Chunked parallel insertion sort of integer keys over shared memory.
+
+    arr[start..end] is split into one contiguous block per worker; the
+    blocks are insertion sorted in parallel and then combined by a single
+    parallel p-way merge in which every worker produces one equal slice of
+    the output. One pool of at most `workers` processes is used throughout.
+    """
+    if end is None:
+        end = len(arr) - 1
+    n = end - start + 1
+    if n < 2:
+        return
+    workers = max(1, min(workers or os.cpu_count() or 1, n))
+    bounds = [n * i // workers for i in range(workers + 1)]
+
+    shm = shared_memory.SharedMemory(create=True, size=2 * n * 8)
+    buf = shm.buf[:2 * n * 8].cast("q")
+    try:
+        buf[:n] = array("q", arr[start:end + 1])
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=shared.attach_shared,
+            initargs=(shm.name, n, "q", 2 * n)
+        ) as executor:
+            list(executor.map(_sort_block, bounds[:-1], bounds[1:]))
+            list(executor.map(_merge_segment, [bounds] * workers, bounds[:-1], bounds[1:]))
+        arr[start:end + 1] = buf[n:].tolist()
+    finally:
+        buf.release()
+        shm.close()
+        shm.unlink()
+
+def parallel_insertion_sort(arr: List[int], start: int = 0, end: int = None,
+                            workers: Optional[int] = None) -> None:
+    """Parallel insertion sort: blocks sorted in parallel, then merged.
+    Keys that are not int64 integers are sorted serially."""
     if end is None:
         end = len(arr) - 1
     
@@ -26,45 +100,13 @@ def parallel_insertion_sort(arr: List[int], start: int = 0, end: int = None) ->
     if end - start < 100:
         insertion_sort_sequential(arr, start, end)
         return
-    
-    # Divide the array into two halves
-    mid = start + (end - start) // 2
-    
-    # Sort both halves in parallel
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-        future1 = executor.submit(parallel_insertion_sort, arr, start, mid)
-        future2 = executor.submit(parallel_insertion_sort, arr, mid + 1, end)
-        
-        # Wait for both halves to complete
-        future1.result()
-        future2.result()
-    
-    # Merge the two sorted halves
-    temp = [0] * (end - start + 1)
-    i, j, k = start, mid + 1, 0
-    
-    while i <= mid and j <= end:
-        if arr[i] <= arr[j]:
-            temp[k] = arr[i]
-            i += 1
-        else:
-            temp[k] = arr[j]
-            j += 1
-        k += 1
-    
-    while i <= mid:
-        temp[k] = arr[i]
-        i += 1
-        k += 1
-    
-    while j <= end:
-        temp[k] = arr[j]
-        j += 1
-        k += 1
-    
-    # Copy back to original array
-    for i in range(k):
-        arr[start + i] = temp[i]
+
+    # Keys that do not fit the shared int64 buffer are sorted in this process
+    if shared.key_typecode(arr[start:end + 1]) != "q":
+        binaryInsertionSort(arr, start, end)
+        return
+
+    chunked_insertion_sort(arr, workers, start, end)
 
 def print_array(arr: List[int]) -> None:
     """Print array elements"""
@@ -83,3 +125,8 @@ if __name__ == "__main__":
     
     print("Sorted array: ", end="")
     print_array(arr)
+
+    arr = [12, 11, 13, 5, 6, 7, 8, 1, 9, 2, 4, 3, 400]
+    chunked_insertion_sort(arr, workers=4)
+    print("Sorted array (chunked): ", end="")
+    print_array(arr)
@@ -0,0 +1,153 @@
+import os
+import sys
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    from common import shared
+except ImportError:  # run as a script from inside insertion/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common import shared
+
+# Passes with a gap below this run serially in the parent: they have too
+# few chains to share out, and by then the data is nearly sorted
+SERIAL_GAP = 16
+
+
+def ciura_gaps(n):
+    # Ciura's empirical sequence, extended by a factor of 2.25
+    gaps = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
+    while gaps[-1] * 2.25 < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return gaps
+
+
+def tokuda_gaps(n):
+    # Tokuda: ceil((9 * (9/4)**k - 4) / 5)
+    gaps = []
+    k = 0
+    while True:
+        h = -(-(9 * 9 ** k - 4 * 4 ** k) // (5 * 4 ** k))
+        if gaps and h >= n:
+            return gaps
+        gaps.append(h)
+        k += 1
+
+
+def sedgewick_gaps(n):
+    # Sedgewick 1986: 1, then 4**k + 3 * 2**(k - 1) + 1
+    gaps = [1]
+    k = 1
+    while 4 ** k + 3 * 2 ** (k - 1) + 1 < n:
+        gaps.append(4 ** k + 3 * 2 ** (k - 1) + 1)
+        k += 1
+    return gaps
+
+
+GAP_SEQUENCES = {
+    "ciura": ciura_gaps,
+    "tokuda": tokuda_gaps,
+    "sedgewick": sedgewick_gaps,
+}
+
+
+def gap_sequence(name, n):
+    # Gaps for n elements, largest first; always ends with 1
+    if name not in GAP_SEQUENCES:
+        raise ValueError(f"unknown gap sequence: {name!r}")
+    return [h for h in reversed(GAP_SEQUENCES[name](n)) if h < n or h == 1]
+
+
+def insertion_sort_run(run):
+    # Insertion sort of one extracted chain. Elements already in place
+    # cost one comparison; the others are placed by bisect and the range
+    # between is shifted by a slice assignment.
+    for i in range(1, len(run)):
+        key = run[i]
+        if not key < run[i - 1]:
+            continue
+        pos = bisect_right(run, key, 0, i - 1)
+        run[pos + 1:i + 1] = run[pos:i]
+        run[pos] = key
+
+
+def _h_sort(arr, h):
+    # One Shell pass: the h chains arr[c::h] are insertion sorted one by one
+    for c in range(h):
+        run = arr[c::h]
+        insertion_sort_run(run)
+        arr[c::h] = run
+
+
+def shell_sort(arr, gaps="ciura"):
+    # Serial Shell sort: an h-sort for every gap of the sequence
+    for h in gap_sequence(gaps, len(arr)):
+        _h_sort(arr, h)
+    return arr
+
+
+def _sort_chains(h, c0, c1):
+    # Insertion sort chains c0..c1-1 of gap h, read and written as
+    # strided slices of the shared buffer
+    for c in range(c0, c1):
+        run = shared.buf[c::h].tolist()
+        insertion_sort_run(run)
+        shared.buf[c::h] = array("q", run)
+
+
+def shell_sort_parallel(arr, gaps="ciura", max_workers=None):
+    # Parallel Shell sort of integer keys. The h chains of a pass are
+    # independent, so every pass with a gap of at least SERIAL_GAP splits
+    # its chains among the workers of one pool over a shared buffer; the
+    # remaining small-gap passes run serially on the result.
+    n = len(arr)
+    max_workers = max_workers or os.cpu_count() or 1
+    seq = gap_sequence(gaps, n)
+    large = [h for h in seq if h >= SERIAL_GAP]
+    if max_workers == 1 or not large:
+        return shell_sort(arr, gaps)
+
+    shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    buf = shm.buf[:n * 8].cast("q")
+    try:
+        buf[:] = array("q", arr)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=shared.attach_shared, initargs=(shm.name, n)
+        ) as executor:
+            for h in large:
+                parts = min(max_workers, h)
+                bounds = [h * p // parts for p in range(parts + 1)]
+                list(executor.map(_sort_chains, [h] * parts, bounds[:-1], bounds[1:]))
+        arr[:] = buf.tolist()
+    finally:
+        buf.release()
+        shm.close()
+        shm.unlink()
+
+    for h in seq[len(large):]:
+        _h_sort(arr, h)
+    return arr
+
+
+def print_array(arr):
+    for v in arr:
+        print(v, end=" ")
+    print()
+
+
+if __name__ == "__main__":
+    data = [64, 34, 25, 12, 22, 11, 90, 5, 3, 8, 7, 2]
+    print("Original array: ", end="")
+    print_array(data)
+    shell_sort(data)
+    print("Sorted array: ", end="")
+    print_array(data)
+    assert data == sorted(data)
+
+    for name in GAP_SEQUENCES:
+        data = [64, 34, 25, 12, 22, 11, 90, 5, 3, 8, 7, 2] * 10
+        shell_sort_parallel(data, gaps=name, max_workers=4)
+        print(f"Gaps ({name}): {gap_sequence(name, len(data))}")
+        assert data == sorted(data)
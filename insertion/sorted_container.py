@@ -0,0 +1,160 @@
+# Sorted container for streams of inserts, in sqrt-decomposed chunks
+import os
+import sys
+from bisect import bisect_left, bisect_right
+from itertools import chain
+from math import isqrt
+from typing import Iterable, Iterator, List, Optional
+
+try:
+    from merge.merge_path import merge_runs
+except ImportError:  # run as a script from inside insertion/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from merge.merge_path import merge_runs
+
+# Smallest chunk length; below this the sqrt layout is not worth its overhead
+MIN_CHUNK = 64
+
+class SortedChunks:
+    """Sorted multiset kept as a list of sorted chunks of about sqrt(n) items.
+
+    A single add bisects the chunk maxima, then insertion sorts the value
+    into one chunk: O(sqrt(n)) moves instead of O(n). A large batch is
+    sorted on its own and merged with the store in one linear pass.
+    Equal values keep their insertion order.
+    """
+
+    def __init__(self, values: Iterable[int] = ()):
+        self.chunks: List[List[int]] = []
+        self.maxes: List[int] = []
+        self.size = 0
+        self.update(values)
+
+    def _chunk_length(self) -> int:
+        return max(MIN_CHUNK, isqrt(self.size))
+
+    def _rebuild(self, flat: List[int]) -> None:
+        """Re-chunk a sorted list into chunks of _chunk_length items"""
+        self.size = len(flat)
+        step = self._chunk_length()
+        self.chunks = [flat[i:i + step] for i in range(0, len(flat), step)]
+        self.maxes = [c[-1] for c in self.chunks]
+
+    def add(self, value: int) -> None:
+        """Insert one value in O(sqrt(n))"""
+        if not self.chunks:
+            self.chunks.append([value])
+            self.maxes.append(value)
+            self.size = 1
+            return
+        c = bisect_right(self.maxes, value)
+        if c == len(self.chunks):
+            c -= 1
+            self.chunks[c].append(value)
+            self.maxes[c] = value
+        else:
+            chunk = self.chunks[c]
+            chunk.insert(bisect_right(chunk, value), value)
+        self.size += 1
+
+        # Split a chunk that has grown to twice the target length
+        step = self._chunk_length()
+        chunk = self.chunks[c]
+        if len(chunk) > 2 * step:
+            self.chunks[c:c + 1] = [chunk[:step], chunk[step:]]
+            self.maxes[c:c + 1] = [chunk[step - 1], chunk[-1]]
+
+    def update(self, values: Iterable[int]) -> None:
+        """Insert a batch. Small batches go through add; larger ones are
+        sorted and merged with the store in one linear pass."""
+        batch = sorted(values)
+        if not batch:
+            return
+        if len(batch) * self._chunk_length() < self.size:
+            for value in batch:
+                self.add(value)
+            return
+        self._rebuild(merge_runs(list(chain.from_iterable(self.chunks)), batch))
+
+    def remove(self, value: int) -> None:
+        """Remove one occurrence of value; KeyError if absent"""
+        c = bisect_left(self.maxes, value)
+        if c == len(self.chunks):
+            raise KeyError(value)
+        chunk = self.chunks[c]
+        i = bisect_left(chunk, value)
+        if chunk[i] != value:
+            raise KeyError(value)
+        del chunk[i]
+        self.size -= 1
+        if not chunk:
+            del self.chunks[c]
+            del self.maxes[c]
+        else:
+            self.maxes[c] = chunk[-1]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[int]:
+        return chain.from_iterable(self.chunks)
+
+    def __reversed__(self) -> Iterator[int]:
+        for chunk in reversed(self.chunks):
+            yield from reversed(chunk)
+
+    def __contains__(self, value: int) -> bool:
+        c = bisect_left(self.maxes, value)
+        if c == len(self.chunks):
+            return False
+        chunk = self.chunks[c]
+        return chunk[bisect_left(chunk, value)] == value
+
+    def __getitem__(self, index: int) -> int:
+        """Item at a position in sorted order, in O(sqrt(n))"""
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("SortedChunks index out of range")
+        for chunk in self.chunks:
+            if index < len(chunk):
+                return chunk[index]
+            index -= len(chunk)
+
+    def irange(self, lo: Optional[int] = None, hi: Optional[int] = None,
+               inclusive: bool = True) -> Iterator[int]:
+        """Iterate over the values in [lo, hi] ([lo, hi) if not inclusive);
+        None leaves that side open"""
+        c = 0 if lo is None else bisect_left(self.maxes, lo)
+        for chunk in self.chunks[c:]:
+            i = 0 if lo is None else bisect_left(chunk, lo)
+            if hi is None:
+                j = len(chunk)
+            elif inclusive:
+                j = bisect_right(chunk, hi)
+            else:
+                j = bisect_left(chunk, hi)
+            yield from chunk[i:j]
+            if j < len(chunk):
+                return
+            lo = None
+
+    def __repr__(self) -> str:
+        return f"SortedChunks({list(self)!r})"
+
+def print_array(arr: List[int]) -> None:
+    """Print array elements"""
+    for val in arr:
+        print(val, end=" ")
+    print()
+
+# Driver method
+if __name__ == "__main__":
+    store = SortedChunks([12, 11, 13, 5, 6])
+    store.update([7, 1, 9, 2, 4, 3, 400])
+    store.add(8)
+    print("Sorted store: ", end="")
+    print_array(list(store))
+    print("Range [4, 9]: ", end="")
+    print_array(list(store.irange(4, 9)))
+    assert list(store) == sorted([12, 11, 13, 5, 6, 7, 1, 9, 2, 4, 3, 400, 8])
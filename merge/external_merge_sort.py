@@ -0,0 +1,132 @@
+# External (out-of-core) merge sort for fixed-width binary files
+import argparse
+import concurrent.futures
+import os
+import shutil
+import tempfile
+from array import array
+from typing import List, Optional
+
+try:
+    from merge.kway_merge import kway_merge, read_run_file, write_run_file
+    from merge.merge import mergeSortBottomUp
+except ImportError:  # run as a script from inside merge/
+    from kway_merge import kway_merge, read_run_file, write_run_file
+    from merge import mergeSortBottomUp
+
+# Bytes a Python list holds per boxed int while a chunk is being sorted:
+# the list slot, the int object and the bottom-up merge buffer slot. The
+# fixed-width array copy made when reading or spilling the chunk comes
+# on top of this (itemsize bytes per item).
+LIST_BYTES_PER_ITEM = 48
+
+# Resident memory of one worker process before it holds any data
+# (interpreter plus imported modules), charged once per process
+WORKER_BASE_BYTES = 32 << 20
+
+# Runs merged at once; more runs are merged in several passes
+MAX_FAN_IN = 256
+
+def _sort_chunk(input_path: str, run_path: str, start: int, count: int, typecode: str) -> str:
+    """Worker task: read items [start, start + count) of the input, sort
+    them and spill them as a fixed-width binary run"""
+    block = array(typecode)
+    with open(input_path, "rb") as f:
+        f.seek(start * block.itemsize)
+        block.fromfile(f, count)
+    chunk = block.tolist()
+    del block
+    mergeSortBottomUp(chunk, 0, len(chunk) - 1)
+    write_run_file(run_path, chunk, typecode)
+    return run_path
+
+def _merge_runs_to_file(run_paths: List[str], output_path: str, typecode: str,
+                        memory_budget: int) -> None:
+    """K-way merge run files into output_path with buffered reads and writes"""
+    itemsize = array(typecode).itemsize
+    # One read buffer per run plus the write buffer share the budget
+    buffer_items = max(1, memory_budget // (2 * itemsize * (len(run_paths) + 1)))
+    out = array(typecode)
+    with open(output_path, "wb") as f:
+        runs = [read_run_file(p, typecode, buffer_items) for p in run_paths]
+        for value in kway_merge(runs):
+            out.append(value)
+            if len(out) >= buffer_items:
+                out.tofile(f)
+                out = array(typecode)
+        out.tofile(f)
+
+def external_merge_sort(input_path: str, output_path: str,
+                        memory_budget: int = 1 << 30,
+                        workers: Optional[int] = None,
+                        typecode: str = "q",
+                        tmp_dir: Optional[str] = None) -> None:
+    """Sort a binary file of fixed-width integers that may not fit in RAM.
+
+    The input is read in chunks sized so that all workers together,
+    including their per-process base cost, stay within memory_budget
+    bytes. Each worker sorts one chunk and spills it as a binary run;
+    the runs are then k-way merged with buffered I/O, in several passes
+    if there are more than MAX_FAN_IN of them.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    itemsize = array(typecode).itemsize
+    n = os.path.getsize(input_path) // itemsize
+
+    # The parent and every worker pay WORKER_BASE_BYTES; drop workers that
+    # would leave them less than that again for data
+    workers = min(workers, memory_budget // (2 * WORKER_BASE_BYTES) - 1)
+    if workers < 1:
+        raise ValueError(f"memory budget of {memory_budget} bytes is too small")
+    data_budget = memory_budget - (workers + 1) * WORKER_BASE_BYTES
+    chunk_items = max(1, data_budget // (workers * (LIST_BYTES_PER_ITEM + itemsize)))
+
+    run_dir = tempfile.mkdtemp(prefix="extsort_", dir=tmp_dir)
+    try:
+        starts = range(0, n, chunk_items)
+        run_paths = [os.path.join(run_dir, f"run_{i}.bin") for i in range(len(starts))]
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_sort_chunk, input_path, path, start,
+                                min(chunk_items, n - start), typecode)
+                for start, path in zip(starts, run_paths)
+            ]
+            for future in futures:
+                future.result()
+
+        merge_pass = 0
+        while len(run_paths) > MAX_FAN_IN:
+            merged = []
+            for g in range(0, len(run_paths), MAX_FAN_IN):
+                path = os.path.join(run_dir, f"pass{merge_pass}_{g}.bin")
+                _merge_runs_to_file(run_paths[g:g + MAX_FAN_IN], path, typecode, data_budget)
+                for p in run_paths[g:g + MAX_FAN_IN]:
+                    os.remove(p)
+                merged.append(path)
+            run_paths = merged
+            merge_pass += 1
+        _merge_runs_to_file(run_paths, output_path, typecode, data_budget)
+    finally:
+        shutil.rmtree(run_dir, ignore_errors=True)
+
+def parse_size(text: str) -> int:
+    """Parse a byte count such as 512M or 16G"""
+    units = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+    text = text.strip().upper().rstrip("B")
+    if text and text[-1] in units:
+        return int(float(text[:-1]) * units[text[-1]])
+    return int(text)
+
+# Driver code
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="External merge sort of a binary int64 file")
+    parser.add_argument("input")
+    parser.add_argument("output")
+    parser.add_argument("--memory", default="1G", help="memory budget, e.g. 16G")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--tmp-dir", default=None)
+    args = parser.parse_args()
+
+    external_merge_sort(args.input, args.output, parse_size(args.memory),
+                        args.workers, tmp_dir=args.tmp_dir)
+    print(f"Sorted {args.input} -> {args.output}")
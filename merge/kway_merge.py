@@ -0,0 +1,122 @@
+# K-way merge of sorted runs with a loser (tournament) tree
+import os
+from array import array
+from typing import Iterable, Iterator, MutableSequence, Sequence
+
+# Default number of items read per block from an on-disk run
+RUN_BUFFER_ITEMS = 1 << 16
+
+# Marks an exhausted run
+_DONE = object()
+
+class LoserTree:
+    """Tournament tree over k sorted runs.
+
+    Internal node i stores the loser of the match played there and tree[0]
+    the overall winner, so replacing the winner replays only its leaf-to-root
+    path: log2(k) comparisons per output element. Ties go to the lower run
+    index, which makes the merge stable.
+    """
+
+    def __init__(self, runs: Iterable[Iterable[int]]):
+        self.iters = [iter(run) for run in runs]
+        self.k = len(self.iters)
+        self.keys = [None] * self.k
+        self.live = [False] * self.k
+        for r, it in enumerate(self.iters):
+            value = next(it, _DONE)
+            if value is not _DONE:
+                self.keys[r] = value
+                self.live[r] = True
+        self.tree = [0] * max(1, self.k)
+        self._build()
+
+    def _beats(self, a: int, b: int) -> bool:
+        """True if run a's head comes before run b's head"""
+        if not self.live[a]:
+            return False
+        if not self.live[b]:
+            return True
+        ka, kb = self.keys[a], self.keys[b]
+        return ka < kb or (a < b and not kb < ka)
+
+    def _build(self) -> None:
+        k = self.k
+        if k == 0:
+            return
+        winners = [0] * (2 * k)
+        for r in range(k):
+            winners[k + r] = r
+        for node in range(k - 1, 0, -1):
+            a, b = winners[2 * node], winners[2 * node + 1]
+            if self._beats(a, b):
+                winners[node], self.tree[node] = a, b
+            else:
+                winners[node], self.tree[node] = b, a
+        self.tree[0] = winners[1] if k > 1 else 0
+
+    def __iter__(self) -> Iterator[int]:
+        k, tree, keys, live, iters = self.k, self.tree, self.keys, self.live, self.iters
+        if k == 0:
+            return
+        while True:
+            w = tree[0]
+            if not live[w]:
+                return
+            yield keys[w]
+
+            # Advance the winning run and replay its path to the root
+            value = next(iters[w], _DONE)
+            if value is _DONE:
+                live[w] = False
+            else:
+                keys[w] = value
+            node = (w + k) >> 1
+            while node:
+                c = tree[node]
+                # Inlined _beats(c, w)
+                if live[c] and (not live[w] or keys[c] < keys[w]
+                                or (c < w and not keys[w] < keys[c])):
+                    tree[node], w = w, c
+                node >>= 1
+            tree[0] = w
+
+def kway_merge(runs: Iterable[Iterable[int]]) -> Iterator[int]:
+    """Lazily merge any number of sorted runs in a single pass.
+
+    Runs may be lists, memoryview slices of a shared-memory buffer, or
+    iterators such as read_run_file() over on-disk runs.
+    """
+    return iter(LoserTree(runs))
+
+def kway_merge_into(runs: Iterable[Iterable[int]], out: MutableSequence[int], start: int = 0) -> None:
+    """Merge sorted runs into out[start:start + total length]"""
+    k = start
+    for value in kway_merge(runs):
+        out[k] = value
+        k += 1
+
+def write_run_file(path: str, values: Sequence[int], typecode: str = "q") -> None:
+    """Spill a sorted run as fixed-width binary"""
+    with open(path, "wb") as f:
+        array(typecode, values).tofile(f)
+
+def read_run_file(path: str, typecode: str = "q",
+                  buffer_items: int = RUN_BUFFER_ITEMS) -> Iterator[int]:
+    """Stream a fixed-width binary run back in blocks of buffer_items"""
+    itemsize = array(typecode).itemsize
+    remaining = os.path.getsize(path) // itemsize
+    with open(path, "rb") as f:
+        while remaining:
+            block = array(typecode)
+            count = min(buffer_items, remaining)
+            block.fromfile(f, count)
+            remaining -= count
+            yield from block
+
+# Driver code
+if __name__ == "__main__":
+    runs = [[1, 4, 9, 12], [2, 3, 10], [], [5, 6, 7, 8, 11], [0, 13]]
+    merged = list(kway_merge(runs))
+    print("Merged runs:", merged)
+    assert merged == sorted(sum(runs, []))
@@ -49,11 +49,61 @@ def mergeSort(arr, left, right):
         mergeSort(arr, mid + 1, right)
         merge(arr, left, mid, right)
 
+# Bottom-up variant: one auxiliary buffer, no recursion.
+# Each pass merges runs of length width from src into dst,
+# then the two buffers swap roles.
+def mergePass(src, s0, dst, d0, n, width):
+    for lo in range(0, n, 2 * width):
+        mid = min(lo + width, n)
+        hi = min(lo + 2 * width, n)
+        i, iend = s0 + lo, s0 + mid
+        j, jend = s0 + mid, s0 + hi
+        k = d0 + lo
+
+        while i < iend and j < jend:
+            if src[i] <= src[j]:
+                dst[k] = src[i]
+                i += 1
+            else:
+                dst[k] = src[j]
+                j += 1
+            k += 1
+
+        # Copy whichever run is left over (this also
+        # carries an unpaired tail run) as one slice
+        if i < iend:
+            dst[k:k + iend - i] = src[i:iend]
+        else:
+            dst[k:k + jend - j] = src[j:jend]
+
+def mergeSortBottomUp(arr, left, right):
+    n = right - left + 1
+    if n < 2:
+        return
+
+    aux = [0] * n
+    src, s0, dst, d0 = arr, left, aux, 0
+    width = 1
+    while width < n:
+        mergePass(src, s0, dst, d0, n, width)
+        src, s0, dst, d0 = dst, d0, src, s0
+        width *= 2
+
+    # After an odd number of passes the result sits in aux
+    if src is aux:
+        arr[left:right + 1] = aux
+
 # Driver code
 if __name__ == "__main__":
     arr = [38, 27, 43, 10]
    
     mergeSort(arr, 0, len(arr) - 1)
+    for i in arr:
+        print(i, end=" ")
+    print()
+
+    arr = [38, 27, 43, 10, 82, 5, 7]
+    mergeSortBottomUp(arr, 0, len(arr) - 1)
     for i in arr:
         print(i, end=" ")
     print()
\ No newline at end of file
@@ -1,6 +1,11 @@
 import multiprocessing
 import ctypes
 
+try:
+    from merge.merge_path import co_rank, merge_runs
+except ImportError:  # run as a script from inside merge/
+    from merge_path import co_rank, merge_runs
+
 def merge(arr, left, mid, right):
     n1 = mid - left + 1
     n2 = right - mid
@@ -31,32 +36,197 @@ def merge(arr, left, mid, right):
         k += 1
 
 
-def parallel_merge_sort(arr, left, right, depth=0, max_depth=2):
+def merge_segment(arr, tmp, left, mid, right, k0, k1):
+    # Output positions [k0, k1) of merging arr[left..mid] and arr[mid+1..right].
+    # The co-ranks are found in place; only this segment's inputs are copied.
+    i0 = co_rank(k0, arr, arr, left, mid + 1, mid + 1, right + 1)
+    i1 = co_rank(k1, arr, arr, left, mid + 1, mid + 1, right + 1)
+    b = mid + 1
+    tmp[left + k0:left + k1] = merge_runs(arr[left + i0:left + i1], arr[b + k0 - i0:b + k1 - i1])
+
+
+def parallel_merge(arr, tmp, left, mid, right, parts):
+    # Merge-path merge: every process fills a disjoint slice of tmp
+    n = right - left + 1
+    ks = [n * s // parts for s in range(parts + 1)]
+    procs = [
+        multiprocessing.Process(
+            target=merge_segment,
+            args=(arr, tmp, left, mid, right, k0, k1)
+        )
+        for k0, k1 in zip(ks, ks[1:]) if k0 < k1
+    ]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    arr[left:right + 1] = tmp[left:right + 1]
+
+
+def default_split_depth(processes=None):
+    # Smallest depth whose 2**depth leaves cover every CPU
+    processes = processes or multiprocessing.cpu_count()
+    return max(0, (processes - 1).bit_length())
+
+
+def _element_type(arr):
+    # ctypes element type of a multiprocessing.Array, with or without lock
+    obj = arr.get_obj() if hasattr(arr, "get_obj") else arr
+    return getattr(obj, "_type_", ctypes.c_longlong)
+
+
+def parallel_merge_sort(arr, left, right, depth=0, max_depth=None, tmp=None):
+    if max_depth is None:
+        max_depth = default_split_depth()
+    if tmp is None and depth < max_depth:
+        # The merge-path scratch buffer holds the same element type as arr
+        tmp = multiprocessing.Array(_element_type(arr), len(arr), lock=False)
+
     if left < right:
         mid = (left + right) // 2
 
         if depth < max_depth:
             left_proc = multiprocessing.Process(
                 target=parallel_merge_sort,
-                args=(arr, left, mid, depth + 1, max_depth)
+                args=(arr, left, mid, depth + 1, max_depth, tmp)
             )
             right_proc = multiprocessing.Process(
                 target=parallel_merge_sort,
-                args=(arr, mid + 1, right, depth + 1, max_depth)
+                args=(arr, mid + 1, right, depth + 1, max_depth, tmp)
             )
 
             left_proc.start()
             right_proc.start()
             left_proc.join()
             right_proc.join()
+
+            # Split the merge over as many processes as sorted below it
+            parallel_merge(arr, tmp, left, mid, right, 2 ** (max_depth - depth))
         else:
             # Fallback to serial merge sort
             parallel_merge_sort(arr, left, mid, depth + 1, max_depth)
             parallel_merge_sort(arr, mid + 1, right, depth + 1, max_depth)
+            merge(arr, left, mid, right)
 
+
+def merge_sort_serial(arr, left, right):
+    if left < right:
+        mid = (left + right) // 2
+        merge_sort_serial(arr, left, mid)
+        merge_sort_serial(arr, mid + 1, right)
         merge(arr, left, mid, right)
 
 
+# Shared buffers of the persistent pool, inherited by every worker
+_pool_bufs = None
+
+
+def _init_pool_worker(buf, tmp):
+    global _pool_bufs
+    _pool_bufs = (buf, tmp)
+
+
+def _sort_leaf(src, left, right):
+    buf = _pool_bufs[src]
+    run = buf[left:right + 1]
+    merge_sort_serial(run, 0, len(run) - 1)
+    buf[left:right + 1] = run
+
+
+def _merge_leaf_segment(src, left, mid, right, k0, k1):
+    merge_segment(_pool_bufs[src], _pool_bufs[1 - src], left, mid, right, k0, k1)
+
+
+class MergeSortPool:
+    """Long-lived process pool for merge sorting over multiprocessing.Array.
+
+    The pool and its two shared buffers are created once and reused by
+    every sort() call; they are only rebuilt when an input outgrows them.
+    The split depth follows the number of processes. Buffers hold 64-bit
+    integers by default; values that do not fit ctype raise OverflowError.
+    """
+
+    def __init__(self, processes=None, capacity=0, ctype=ctypes.c_longlong):
+        self.processes = processes or multiprocessing.cpu_count()
+        self.depth = default_split_depth(self.processes)
+        self.ctype = ctype
+        bits = 8 * ctypes.sizeof(ctype)
+        if ctype(-1).value < 0:
+            self.limits = (-(1 << (bits - 1)), (1 << (bits - 1)) - 1)
+        else:
+            self.limits = (0, (1 << bits) - 1)
+        self.capacity = 0
+        self.pool = None
+        if capacity:
+            self._start(capacity)
+
+    def _start(self, capacity):
+        self.close()
+        self.bufs = (
+            multiprocessing.Array(self.ctype, capacity, lock=False),
+            multiprocessing.Array(self.ctype, capacity, lock=False),
+        )
+        self.pool = multiprocessing.Pool(
+            self.processes, initializer=_init_pool_worker, initargs=self.bufs
+        )
+        self.capacity = capacity
+
+    def sort(self, arr, left=0, right=None):
+        if right is None:
+            right = len(arr) - 1
+        n = right - left + 1
+        if n < 2:
+            return
+        # ctypes arrays wrap out-of-range ints silently, so check first
+        low, high = min(arr[left:right + 1]), max(arr[left:right + 1])
+        if low < self.limits[0] or high > self.limits[1]:
+            raise OverflowError(
+                f"values in [{low}, {high}] do not fit {self.ctype.__name__}")
+        if n > self.capacity:
+            self._start(n)
+
+        buf = self.bufs[0]
+        buf[0:n] = arr[left:right + 1]
+        leaves = min(2 ** self.depth, n)
+        bounds = [n * i // leaves for i in range(leaves + 1)]
+        self.pool.starmap(_sort_leaf, [(0, lo, hi - 1) for lo, hi in zip(bounds, bounds[1:])])
+
+        # Merge levels bottom-up, ping-ponging between the two buffers;
+        # each merge is split into merge-path segments so all processes work
+        src = 0
+        while len(bounds) > 2:
+            pairs = range(0, len(bounds) - 2, 2)
+            parts = -(-self.processes // len(pairs))
+            tasks = []
+            for i in pairs:
+                lo, mid, hi = bounds[i], bounds[i + 1], bounds[i + 2]
+                ks = [(hi - lo) * s // parts for s in range(parts + 1)]
+                tasks.extend(
+                    (src, lo, mid - 1, hi - 1, k0, k1)
+                    for k0, k1 in zip(ks, ks[1:]) if k0 < k1
+                )
+            if len(bounds) % 2 == 0:
+                lo, hi = bounds[-2], bounds[-1]
+                self.bufs[1 - src][lo:hi] = self.bufs[src][lo:hi]
+            self.pool.starmap(_merge_leaf_segment, tasks)
+            bounds = bounds[::2] if len(bounds) % 2 else bounds[::2] + [bounds[-1]]
+            src = 1 - src
+
+        arr[left:right + 1] = self.bufs[src][0:n]
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
 if __name__ == "__main__":
     # Input array
     original = [38, 27, 43, 10, 82, 5, 7, 11, 55, 31]
@@ -70,3 +240,10 @@ if __name__ == "__main__":
     # Convert back to list and print
     sorted_arr = list(shared_array)
     print("Sorted array:", sorted_arr)
+
+    # Reuse one pool for several sorts
+    with MergeSortPool() as pool:
+        for data in ([9, 4, 7, 1, 8, 2], original):
+            data = list(data)
+            pool.sort(data)
+            print("Sorted with pool:", data)
@@ -1,6 +1,29 @@
 # Python program for parallel implementation of Merge Sort
 import concurrent.futures
-from typing import List
+import os
+import sys
+from array import array
+from multiprocessing import shared_memory
+from typing import List, Optional
+
+try:
+    from merge.kway_merge import kway_merge_into
+    from merge.merge_path import co_rank, merge_runs
+except ImportError:  # run as a script from inside merge/
+    from kway_merge import kway_merge_into
+    from merge_path import co_rank, merge_runs
+
+try:
+    from common import shared
+    from insertion.insertion import binaryInsertionSort
+except ImportError:  # run as a script from inside merge/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common import shared
+    from insertion.insertion import binaryInsertionSort
+
+# Ranges of at most this many elements are finished with binary
+# insertion sort instead of further merge sort recursion (0 disables)
+INSERTION_CUTOFF = 32
 
 def merge(arr: List[int], left: int, mid: int, right: int) -> None:
     """Merge two sorted subarrays"""
@@ -46,17 +69,119 @@ def merge(arr: List[int], left: int, mid: int, right: int) -> None:
         j += 1
         k += 1
 
-def parallel_merge_sort(arr: List[int], left: int, right: int) -> None:
-    """Parallel merge sort implementation"""
+def merge_sort_sequential(arr: List[int], left: int, right: int) -> None:
+    """Sequential merge sort for a subarray"""
+    if right - left < INSERTION_CUTOFF:
+        binaryInsertionSort(arr, left, right)
+    elif left < right:
+        mid = (left + right) // 2
+        merge_sort_sequential(arr, left, mid)
+        merge_sort_sequential(arr, mid + 1, right)
+        merge(arr, left, mid, right)
+
+# The process-based mode's shared buffer holds two halves of n slots
+# each that take turns as merge source and destination.
+
+def _sort_range(lo: int, hi: int) -> None:
+    """Worker task: sort the shared slice [lo, hi)"""
+    run = shared.buf[lo:hi].tolist()
+    merge_sort_sequential(run, 0, len(run) - 1)
+    shared.buf[lo:hi] = array("q", run)
+
+def _merge_segment(src: int, dst: int, lo: int, mid: int, hi: int, k0: int, k1: int) -> None:
+    """Worker task: write output positions [k0, k1) of merging the sorted
+    runs src[lo:mid] and src[mid:hi] into dst[lo + k0:lo + k1]"""
+    a = shared.buf[src + lo:src + mid]
+    b = shared.buf[src + mid:src + hi]
+    i0 = co_rank(k0, a, b)
+    i1 = co_rank(k1, a, b)
+    segment = merge_runs(a[i0:i1].tolist(), b[k0 - i0:k1 - i1].tolist())
+    shared.buf[dst + lo + k0:dst + lo + k1] = array("q", segment)
+
+def parallel_merge_sort_processes(arr: List[int], left: int, right: int,
+                                  workers: Optional[int] = None, kway: bool = False) -> None:
+    """Process-based merge sort over a shared-memory buffer.
+
+    arr[left..right] is copied once into a shared int64 buffer. A fixed pool
+    sorts one contiguous slice per worker, then adjacent runs are merged in
+    rounds. Each merge is cut into merge-path segments so that every round,
+    including the last one, keeps all workers busy. Tasks carry only index
+    ranges, never list data.
+
+    With kway=True the sorted slices are instead merged straight into arr
+    by a single loser-tree pass in the parent.
+    """
+    n = right - left + 1
+    if n <= 1:
+        return
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, n))
+
+    shm = shared_memory.SharedMemory(create=True, size=2 * n * 8)
+    buf = shm.buf[:2 * n * 8].cast("q")
+    try:
+        buf[:n] = array("q", arr[left:right + 1])
+        bounds = [n * i // workers for i in range(workers + 1)]
+        src, dst = 0, n
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers, initializer=shared.attach_shared,
+            initargs=(shm.name, n, "q", 2 * n)
+        ) as executor:
+            list(executor.map(_sort_range, bounds[:-1], bounds[1:]))
+            if kway:
+                runs = [buf[lo:hi] for lo, hi in zip(bounds, bounds[1:])]
+                kway_merge_into(runs, arr, left)
+                for run in runs:
+                    run.release()
+                return
+
+            # Merge neighbouring runs pairwise until one run is left
+            while len(bounds) > 2:
+                pairs = range(0, len(bounds) - 2, 2)
+                parts = -(-workers // len(pairs))
+                futures = []
+                for i in pairs:
+                    lo, mid, hi = bounds[i], bounds[i + 1], bounds[i + 2]
+                    ks = [(hi - lo) * s // parts for s in range(parts + 1)]
+                    futures.extend(
+                        executor.submit(_merge_segment, src, dst, lo, mid, hi, k0, k1)
+                        for k0, k1 in zip(ks, ks[1:]) if k0 < k1
+                    )
+                if len(bounds) % 2 == 0:
+                    # Odd run count: the last run has no partner this round
+                    lo, hi = bounds[-2], bounds[-1]
+                    buf[dst + lo:dst + hi] = buf[src + lo:src + hi]
+                for future in futures:
+                    future.result()
+                bounds = bounds[::2] if len(bounds) % 2 else bounds[::2] + [bounds[-1]]
+                src, dst = dst, src
+        arr[left:right + 1] = buf[src:src + n].tolist()
+    finally:
+        buf.release()
+        shm.close()
+        shm.unlink()
+
+def parallel_merge_sort(arr: List[int], left: int, right: int,
+                        mode: str = "threads", workers: Optional[int] = None,
+                        kway: bool = False) -> None:
+    """Parallel merge sort implementation
+
+    mode="threads" splits recursively onto thread pools; mode="processes"
+    sorts in a process pool over shared memory (integer keys only), merging
+    the sorted slices pairwise or, with kway=True, in one k-way pass.
+    """
+    if mode == "processes":
+        parallel_merge_sort_processes(arr, left, right, workers, kway)
+        return
+    if mode != "threads":
+        raise ValueError(f"unknown mode: {mode!r}")
+
     if left >= right:
         return
     
     # For small arrays, use sequential merge sort
     if right - left < 100:
-        mid = (left + right) // 2
-        parallel_merge_sort(arr, left, mid)
-        parallel_merge_sort(arr, mid + 1, right)
-        merge(arr, left, mid, right)
+        merge_sort_sequential(arr, left, right)
         return
 
     mid = (left + right) // 2
@@ -90,3 +215,15 @@ if __name__ == "__main__":
     
     print("Sorted array: ", end="")
     print_array(arr)
+
+    data = [38, 27, 43, 10, 15, 8, 22, 5, 12, 3, 18, 7]
+    parallel_merge_sort(data, 0, len(data) - 1, mode="processes", workers=4)
+    print("Sorted array (processes): ", end="")
+    print_array(data)
+    assert data == sorted(data)
+
+    data = [38, 27, 43, 10, 15, 8, 22, 5, 12, 3, 18, 7]
+    parallel_merge_sort(data, 0, len(data) - 1, mode="processes", workers=4, kway=True)
+    print("Sorted array (processes, k-way): ", end="")
+    print_array(data)
+    assert data == sorted(data)
@@ -0,0 +1,136 @@
+# Merge-path (co-rank) parallel merge of two sorted sequences
+import concurrent.futures
+import os
+from bisect import bisect_left, bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+def co_rank(k: int, a: Sequence[int], b: Sequence[int],
+            a_lo: int = 0, a_hi: Optional[int] = None,
+            b_lo: int = 0, b_hi: Optional[int] = None) -> int:
+    """Return i such that a[:i] and b[:k - i] are the k smallest elements.
+
+    Ties are taken from a first, so merging segment by segment is stable.
+    With bounds, a and b are the runs a[a_lo:a_hi] and b[b_lo:b_hi] (both
+    may be the same array) and i is relative to a_lo; nothing is copied.
+    """
+    n1 = (len(a) if a_hi is None else a_hi) - a_lo
+    n2 = (len(b) if b_hi is None else b_hi) - b_lo
+    lo = max(0, k - n2)
+    hi = min(k, n1)
+    while lo < hi:
+        i = (lo + hi) // 2
+        if a[a_lo + i] <= b[b_lo + k - i - 1]:
+            lo = i + 1
+        else:
+            hi = i
+    return lo
+
+def merge_path_splits(a: Sequence[int], b: Sequence[int], parts: int) -> List[Tuple[int, int]]:
+    """Split the merge of a and b into parts equal output segments.
+
+    Returns parts + 1 boundaries (i, j); segment s merges
+    a[i_s:i_s+1] with b[j_s:j_s+1] into out[i_s + j_s:i_s+1 + j_s+1].
+    """
+    n = len(a) + len(b)
+    splits = []
+    for s in range(parts + 1):
+        k = n * s // parts
+        i = co_rank(k, a, b)
+        splits.append((i, k - i))
+    return splits
+
+def multiway_co_rank(runs: Sequence[Sequence[int]], k: int) -> List[int]:
+    """Generalised co-rank for any number of sorted runs.
+
+    Returns one position per run such that the prefixes runs[i][:pos[i]]
+    together hold the k smallest elements. Ties are taken from earlier runs
+    first, matching the stable k-way merge, so consecutive ranks give
+    nested prefixes and every segment can be merged independently.
+    """
+    total = sum(len(run) for run in runs)
+    if k <= 0:
+        return [0] * len(runs)
+    if k >= total:
+        return [len(run) for run in runs]
+
+    # Find the value v of rank k - 1: keep per-run candidate windows and
+    # narrow them around the median of the widest window
+    lo = [0] * len(runs)
+    hi = [len(run) for run in runs]
+    while True:
+        i = max(range(len(runs)), key=lambda r: hi[r] - lo[r])
+        v = runs[i][(lo[i] + hi[i]) // 2]
+        below = [bisect_left(run, v) for run in runs]
+        upto = [bisect_right(run, v) for run in runs]
+        if sum(below) > k - 1:
+            hi = [min(h, b) for h, b in zip(hi, below)]
+        elif sum(upto) <= k - 1:
+            lo = [max(l, u) for l, u in zip(lo, upto)]
+        else:
+            break
+
+    # Everything below v, then copies of v from the earliest runs
+    pos = below
+    need = k - sum(below)
+    for r in range(len(runs)):
+        take = min(upto[r] - below[r], need)
+        pos[r] += take
+        need -= take
+    return pos
+
+def merge_runs(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    """Merge two sorted sequences into a new list"""
+    out = []
+    i = j = 0
+    n1, n2 = len(a), len(b)
+    while i < n1 and j < n2:
+        if a[i] <= b[j]:
+            out.append(a[i])
+            i += 1
+        else:
+            out.append(b[j])
+            j += 1
+    out.extend(a[i:])
+    out.extend(b[j:])
+    return out
+
+def parallel_merge(a: Sequence[int], b: Sequence[int], out: List[int],
+                   workers: Optional[int] = None,
+                   executor: Optional[concurrent.futures.Executor] = None) -> List[int]:
+    """Merge sorted a and b into out[0:len(a) + len(b)] using merge path.
+
+    Co-ranks split the output into one equal segment per worker; the
+    segments are merged concurrently and land in disjoint parts of out.
+    Pass an existing executor to reuse its workers across calls.
+    """
+    n = len(a) + len(b)
+    workers = max(1, min(workers or os.cpu_count() or 1, n))
+    if workers == 1:
+        out[0:n] = merge_runs(a, b)
+        return out
+
+    splits = merge_path_splits(a, b, workers)
+    own_executor = executor is None
+    if own_executor:
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            executor.submit(merge_runs, a[i0:i1], b[j0:j1])
+            for (i0, j0), (i1, j1) in zip(splits, splits[1:])
+        ]
+        for (i0, j0), future in zip(splits, futures):
+            segment = future.result()
+            out[i0 + j0:i0 + j0 + len(segment)] = segment
+    finally:
+        if own_executor:
+            executor.shutdown()
+    return out
+
+# Driver code
+if __name__ == "__main__":
+    a = [1, 3, 5, 7, 9, 11, 13]
+    b = [2, 4, 4, 6, 8, 10, 12, 14, 16]
+    out = [0] * (len(a) + len(b))
+    parallel_merge(a, b, out, workers=4)
+    print("Merged:", out)
+    assert out == sorted(a + b)
@@ -0,0 +1,167 @@
+# Adaptive natural-run merge sort with galloping (Timsort-style)
+from bisect import bisect_left, bisect_right
+from typing import List, Tuple
+
+# Consecutive wins by one side before switching to galloping mode
+MIN_GALLOP = 7
+
+def min_run_length(n: int) -> int:
+    """Minimum run length so that n / minrun is a power of two or just below"""
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+def count_run(arr: List[int], lo: int, hi: int) -> int:
+    """Length of the natural run starting at arr[lo]; a strictly
+    descending run is reversed in place so every run ends up ascending"""
+    run_hi = lo + 1
+    if run_hi == hi:
+        return 1
+    if arr[run_hi] < arr[lo]:
+        while run_hi < hi and arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+        arr[lo:run_hi] = arr[lo:run_hi][::-1]
+    else:
+        while run_hi < hi and not arr[run_hi] < arr[run_hi - 1]:
+            run_hi += 1
+    return run_hi - lo
+
+def binary_insertion_sort(arr: List[int], lo: int, hi: int, start: int) -> None:
+    """Extend the sorted prefix arr[lo:start] to arr[lo:hi]"""
+    for i in range(start, hi):
+        key = arr[i]
+        pos = bisect_right(arr, key, lo, i)
+        arr[pos + 1:i + 1] = arr[pos:i]
+        arr[pos] = key
+
+def gallop_right(key: int, a: List[int], lo: int, hi: int) -> int:
+    """First index in a[lo:hi] whose item is > key, probing lo + 2**m - 1"""
+    prev, ofs = lo, 1
+    while lo + ofs - 1 < hi and not key < a[lo + ofs - 1]:
+        prev = lo + ofs
+        ofs <<= 1
+    return bisect_right(a, key, prev, min(lo + ofs - 1, hi))
+
+def gallop_left(key: int, a: List[int], lo: int, hi: int) -> int:
+    """First index in a[lo:hi] whose item is >= key, probing lo + 2**m - 1"""
+    prev, ofs = lo, 1
+    while lo + ofs - 1 < hi and a[lo + ofs - 1] < key:
+        prev = lo + ofs
+        ofs <<= 1
+    return bisect_left(a, key, prev, min(lo + ofs - 1, hi))
+
+def merge_lo(arr: List[int], lo: int, mid: int, hi: int) -> None:
+    """Merge the adjacent runs arr[lo:mid] and arr[mid:hi], galloping
+    whenever one run keeps winning"""
+    a = arr[lo:mid]
+    i, na = 0, len(a)
+    j, k = mid, lo
+
+    while i < na and j < hi:
+        # One element at a time until one side wins MIN_GALLOP times in a row
+        a_wins = b_wins = 0
+        while i < na and j < hi:
+            if arr[j] < a[i]:
+                arr[k] = arr[j]
+                j += 1
+                b_wins += 1
+                a_wins = 0
+            else:
+                arr[k] = a[i]
+                i += 1
+                a_wins += 1
+                b_wins = 0
+            k += 1
+            if a_wins >= MIN_GALLOP or b_wins >= MIN_GALLOP:
+                break
+
+        # Galloping: move whole blocks found by exponential search
+        while i < na and j < hi:
+            count_a = gallop_right(arr[j], a, i, na) - i
+            if count_a:
+                arr[k:k + count_a] = a[i:i + count_a]
+                k += count_a
+                i += count_a
+                if i == na:
+                    break
+            count_b = gallop_left(a[i], arr, j, hi) - j
+            if count_b:
+                arr[k:k + count_b] = arr[j:j + count_b]
+                k += count_b
+                j += count_b
+            if count_a < MIN_GALLOP and count_b < MIN_GALLOP:
+                break
+
+    # Leftovers of the right run are already in place
+    if i < na:
+        arr[k:k + na - i] = a[i:]
+
+def merge_at(arr: List[int], runs: List[Tuple[int, int]], i: int) -> None:
+    """Merge stack entries i and i + 1"""
+    base_a, len_a = runs[i]
+    base_b, len_b = runs[i + 1]
+    runs[i] = (base_a, len_a + len_b)
+    del runs[i + 1]
+
+    # Skip the prefix of A and the suffix of B that are already in place
+    start = bisect_right(arr, arr[base_b], base_a, base_b)
+    end = bisect_left(arr, arr[base_b - 1], base_b, base_b + len_b)
+    if start < base_b < end:
+        merge_lo(arr, start, base_b, end)
+
+def merge_collapse(arr: List[int], runs: List[Tuple[int, int]]) -> None:
+    """Merge runs on the stack until the run-length invariants hold"""
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if (n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or \
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1]):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        merge_at(arr, runs, n)
+
+def natural_merge_sort(arr: List[int], left: int, right: int) -> None:
+    """Adaptive merge sort of arr[left..right].
+
+    Natural runs are detected (descending ones reversed), short runs are
+    extended to min_run_length with binary insertion, and runs are merged
+    from a stack with galloping. Presorted input costs about n comparisons.
+    """
+    n = right - left + 1
+    if n < 2:
+        return
+    minrun = min_run_length(n)
+    runs = []
+    lo = left
+    while lo <= right:
+        run_len = count_run(arr, lo, right + 1)
+        if run_len < minrun:
+            forced = min(minrun, right + 1 - lo)
+            binary_insertion_sort(arr, lo, lo + forced, lo + run_len)
+            run_len = forced
+        runs.append((lo, run_len))
+        merge_collapse(arr, runs)
+        lo += run_len
+
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+            n -= 1
+        merge_at(arr, runs, n)
+
+def print_array(arr: List[int]) -> None:
+    """Print array elements"""
+    for val in arr:
+        print(val, end=" ")
+    print()
+
+# Driver code
+if __name__ == "__main__":
+    arr = [1, 2, 3, 9, 8, 7, 4, 5, 6, 20, 10, 11, 12, 0]
+    natural_merge_sort(arr, 0, len(arr) - 1)
+    print("Sorted array: ", end="")
+    print_array(arr)
+    assert arr == sorted(arr)
@@ -1,3 +1,13 @@
+import os
+import sys
+
+try:
+    from insertion.insertion import binaryInsertionSort
+except ImportError:  # run as a script from inside quick/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from insertion.insertion import binaryInsertionSort
+
+
 def partition(arr, low, high):
     pivot = arr[high]
     i = low - 1
@@ -9,13 +19,184 @@ def partition(arr, low, high):
     return i + 1
 
 
-def quicksort(arr, low=0, high=None):
+def partition_three_way(arr, low, high):
+    # Dijkstra's Dutch national flag partition around arr[high]:
+    # afterwards arr[low:lt] < pivot == arr[lt:gt+1] < arr[gt+1:high+1]
+    pivot = arr[high]
+    lt, i, gt = low, low, high
+    while i <= gt:
+        if arr[i] < pivot:
+            arr[lt], arr[i] = arr[i], arr[lt]
+            lt += 1
+            i += 1
+        elif pivot < arr[i]:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def partition_dual_pivot(arr, low, high):
+    # Yaroslavskiy's dual-pivot partition with pivots arr[low] <= arr[high]:
+    # afterwards arr[low:lp] < p1 <= arr[lp+1:rp] <= p2 < arr[rp+1:high+1]
+    if arr[high] < arr[low]:
+        arr[low], arr[high] = arr[high], arr[low]
+    p1, p2 = arr[low], arr[high]
+    lt, gt = low + 1, high - 1
+    k = lt
+    while k <= gt:
+        if arr[k] < p1:
+            arr[k], arr[lt] = arr[lt], arr[k]
+            lt += 1
+        elif p2 < arr[k]:
+            while p2 < arr[gt] and k < gt:
+                gt -= 1
+            arr[k], arr[gt] = arr[gt], arr[k]
+            gt -= 1
+            if arr[k] < p1:
+                arr[k], arr[lt] = arr[lt], arr[k]
+                lt += 1
+        k += 1
+    lt -= 1
+    gt += 1
+    arr[low], arr[lt] = arr[lt], arr[low]
+    arr[high], arr[gt] = arr[gt], arr[high]
+    return lt, gt
+
+
+PARTITION_SCHEMES = ("lomuto", "three_way", "dual_pivot")
+
+
+def partition_ranges(arr, low, high, scheme="lomuto"):
+    # Partition arr[low..high] with the given scheme (pivots chosen by
+    # choose_pivot) and return the subranges that still need sorting.
+    # Keys equal to a pivot are never part of a returned range.
+    if scheme == "lomuto":
+        p = choose_pivot(arr, low, high)
+        arr[p], arr[high] = arr[high], arr[p]
+        pi = partition(arr, low, high)
+        return [(low, pi - 1), (pi + 1, high)]
+    if scheme == "three_way":
+        p = choose_pivot(arr, low, high)
+        arr[p], arr[high] = arr[high], arr[p]
+        lt, gt = partition_three_way(arr, low, high)
+        return [(low, lt - 1), (gt + 1, high)]
+    if scheme == "dual_pivot":
+        third = (high - low + 1) // 3
+        a, b = low + third, high - third
+        arr[a], arr[low] = arr[low], arr[a]
+        arr[b], arr[high] = arr[high], arr[b]
+        lp, rp = partition_dual_pivot(arr, low, high)
+        ranges = [(low, lp - 1), (rp + 1, high)]
+        if arr[lp] < arr[rp]:
+            ranges.append((lp + 1, rp - 1))
+        return ranges
+    raise ValueError(f"unknown partition scheme: {scheme!r}")
+
+
+def quicksort(arr, low=0, high=None, mode="classic", scheme="lomuto"):
     if high is None:
         high = len(arr) - 1
+    if mode == "intro":
+        introsort(arr, low, high, scheme)
+        return
+    if mode != "classic":
+        raise ValueError(f"unknown mode: {mode!r}")
     if low < high:
-        pi = partition(arr, low, high)
-        quicksort(arr, low, pi - 1)
-        quicksort(arr, pi + 1, high)
+        if scheme == "lomuto":
+            pi = partition(arr, low, high)
+            quicksort(arr, low, pi - 1)
+            quicksort(arr, pi + 1, high)
+            return
+        for lo, hi in partition_ranges(arr, low, high, scheme):
+            quicksort(arr, lo, hi, mode, scheme)
+
+
+# Introsort: quicksort with robust pivots that falls back to heapsort
+# when recursion gets too deep and to insertion sort on small ranges.
+
+INSERTION_THRESHOLD = 16
+NINTHER_THRESHOLD = 128
+
+
+def median_of_three(arr, a, b, c):
+    if arr[a] < arr[b]:
+        if arr[b] < arr[c]:
+            return b
+        return c if arr[a] < arr[c] else a
+    if arr[a] < arr[c]:
+        return a
+    return c if arr[b] < arr[c] else b
+
+
+def choose_pivot(arr, low, high):
+    # Median of three, or Tukey's ninther on large ranges
+    mid = (low + high) // 2
+    if high - low + 1 < NINTHER_THRESHOLD:
+        return median_of_three(arr, low, mid, high)
+    step = (high - low + 1) // 8
+    return median_of_three(
+        arr,
+        median_of_three(arr, low, low + step, low + 2 * step),
+        median_of_three(arr, mid - step, mid, mid + step),
+        median_of_three(arr, high - 2 * step, high - step, high),
+    )
+
+
+def insertion_sort_range(arr, low, high):
+    for i in range(low + 1, high + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= low and key < arr[j]:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
+
+
+def _sift_down(arr, low, root, end):
+    # Max-heap over arr[low:end] with children of i at 2i+1, 2i+2 (relative)
+    while True:
+        child = 2 * root + 1
+        if child >= end:
+            return
+        if child + 1 < end and arr[low + child] < arr[low + child + 1]:
+            child += 1
+        if not arr[low + root] < arr[low + child]:
+            return
+        arr[low + root], arr[low + child] = arr[low + child], arr[low + root]
+        root = child
+
+
+def heapsort_range(arr, low, high):
+    n = high - low + 1
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(arr, low, root, n)
+    for end in range(n - 1, 0, -1):
+        arr[low], arr[low + end] = arr[low + end], arr[low]
+        _sift_down(arr, low, 0, end)
+
+
+def _introsort(arr, low, high, depth, scheme):
+    while high - low + 1 > INSERTION_THRESHOLD:
+        if depth == 0:
+            heapsort_range(arr, low, high)
+            return
+        depth -= 1
+
+        # Recurse into the smaller sides, loop on the largest one
+        ranges = sorted(partition_ranges(arr, low, high, scheme), key=lambda r: r[1] - r[0])
+        for lo, hi in ranges[:-1]:
+            _introsort(arr, lo, hi, depth, scheme)
+        low, high = ranges[-1]
+    binaryInsertionSort(arr, low, high)
+
+
+def introsort(arr, low=0, high=None, scheme="lomuto"):
+    if high is None:
+        high = len(arr) - 1
+    if low < high:
+        _introsort(arr, low, high, 2 * (high - low + 1).bit_length(), scheme)
 
 
 def print_array(arr):
@@ -32,4 +213,9 @@ if __name__ == "__main__":
     print("Sorted array: ", end="")
     print_array(arr)
 
+    arr = list(range(5000, 0, -1))
+    quicksort(arr, mode="intro")
+    assert arr == sorted(arr)
+    print("Introsort on 5000 reverse-sorted elements: ok")
+
 
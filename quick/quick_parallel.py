@@ -1,33 +1,130 @@
-from concurrent.futures import ProcessPoolExecutor
+import os
+import sys
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
 
+try:
+    from quick.quick import introsort, partition_ranges
+except ImportError:  # run as a script from inside quick/
+    from quick import introsort, partition_ranges
 
-def _quicksort_seq(arr):
+try:
+    from common import shared
+except ImportError:  # run as a script from inside quick/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common import shared
+
+
+def _split(arr, scheme):
+    # Split arr into (bucket, needs_sort) pieces, in output order
+    if scheme == "lomuto":
+        pivot = arr[-1]
+        left = [x for x in arr[:-1] if x <= pivot]
+        right = [x for x in arr[:-1] if x > pivot]
+        return [(left, True), ([pivot], False), (right, True)]
+    if scheme == "three_way":
+        pivot = arr[-1]
+        less, equal, greater = [], [], []
+        for x in arr:
+            if x < pivot:
+                less.append(x)
+            elif pivot < x:
+                greater.append(x)
+            else:
+                equal.append(x)
+        return [(less, True), (equal, False), (greater, True)]
+    if scheme == "dual_pivot":
+        p1, p2 = arr[0], arr[-1]
+        if p2 < p1:
+            p1, p2 = p2, p1
+        less, middle, greater = [], [], []
+        for x in arr[1:-1]:
+            if x < p1:
+                less.append(x)
+            elif p2 < x:
+                greater.append(x)
+            else:
+                middle.append(x)
+        # With p1 == p2 the middle bucket holds only equal keys
+        return [(less, True), ([p1], False), (middle, p1 < p2), ([p2], False), (greater, True)]
+    raise ValueError(f"unknown partition scheme: {scheme!r}")
+
+
+def _quicksort_seq(arr, scheme="lomuto"):
     if len(arr) <= 1:
         return arr
-    pivot = arr[-1]
-    left = [x for x in arr[:-1] if x <= pivot]
-    right = [x for x in arr[:-1] if x > pivot]
-    return _quicksort_seq(left) + [pivot] + _quicksort_seq(right)
+    out = []
+    for bucket, needs_sort in _split(arr, scheme):
+        out.extend(_quicksort_seq(bucket, scheme) if needs_sort else bucket)
+    return out
 
 
-def _quicksort_parallel(arr, depth, cutoff, max_workers):
+def _quicksort_parallel(arr, depth, cutoff, max_workers, scheme="lomuto"):
     if len(arr) <= cutoff or depth <= 0:
-        return _quicksort_seq(arr)
-
-    pivot = arr[-1]
-    left = [x for x in arr[:-1] if x <= pivot]
-    right = [x for x in arr[:-1] if x > pivot]
+        return _quicksort_seq(arr, scheme)
 
+    pieces = _split(arr, scheme)
     with ProcessPoolExecutor(max_workers=max_workers) as executor:
-        left_future = executor.submit(_quicksort_parallel, left, depth - 1, cutoff, max_workers)
-        right_future = executor.submit(_quicksort_parallel, right, depth - 1, cutoff, max_workers)
-        left_sorted = left_future.result()
-        right_sorted = right_future.result()
-    return left_sorted + [pivot] + right_sorted
+        futures = [
+            executor.submit(_quicksort_parallel, bucket, depth - 1, cutoff, max_workers, scheme)
+            if needs_sort else None
+            for bucket, needs_sort in pieces
+        ]
+        out = []
+        for (bucket, _), future in zip(pieces, futures):
+            out.extend(future.result() if future is not None else bucket)
+    return out
+
+
+def quicksort_parallel(arr, max_workers=4, depth=3, cutoff=1_000, scheme="lomuto"):
+    return _quicksort_parallel(list(arr), depth, cutoff, max_workers, scheme)
 
 
-def quicksort_parallel(arr, max_workers=4, depth=3, cutoff=1_000):
-    return _quicksort_parallel(list(arr), depth, cutoff, max_workers)
+def _sort_range_task(lo, hi, grain, scheme, depth):
+    # Sort [lo, hi] serially if small (or if the partition depth budget is
+    # used up), otherwise partition it once and hand the remaining sides
+    # back to the parent as new range tasks
+    run = shared.buf[lo:hi + 1].tolist()
+    if hi - lo + 1 <= grain or depth == 0:
+        introsort(run, scheme=scheme)
+        shared.buf[lo:hi + 1] = array("q", run)
+        return []
+
+    ranges = partition_ranges(run, 0, len(run) - 1, scheme)
+    shared.buf[lo:hi + 1] = array("q", run)
+    return [(lo + a, lo + b, depth - 1) for a, b in ranges if a < b]
+
+
+def quicksort_parallel_shared(arr, max_workers=4, cutoff=10_000, scheme="lomuto"):
+    # In-place quicksort of integer keys over a shared-memory buffer.
+    # Workers receive only (lo, hi) ranges from a single pool, so IPC
+    # volume is O(tasks) rather than O(n log n) pickled elements.
+    n = len(arr)
+    if n <= 1:
+        return arr
+    grain = max(cutoff, n // (8 * max_workers))
+
+    shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    buf = shm.buf[:n * 8].cast("q")
+    try:
+        buf[:] = array("q", arr)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=shared.attach_shared, initargs=(shm.name, n)
+        ) as executor:
+            depth = 2 * n.bit_length()
+            pending = {executor.submit(_sort_range_task, 0, n - 1, grain, scheme, depth)}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for lo, hi, d in future.result():
+                        pending.add(executor.submit(_sort_range_task, lo, hi, grain, scheme, d))
+        arr[:] = buf.tolist()
+    finally:
+        buf.release()
+        shm.close()
+        shm.unlink()
+    return arr
 
 
 def print_array(arr):
@@ -45,4 +142,16 @@ if __name__ == "__main__":
     print_array(out)
     assert out == sorted(data)
 
+    in_place = list(data)
+    quicksort_parallel_shared(in_place, max_workers=4, cutoff=2)
+    print("Sorted array (shared): ", end="")
+    print_array(in_place)
+    assert in_place == sorted(data)
+
+    dups = [3, 1, 2, 3, 3, 1, 2, 2, 3, 1, 1, 3]
+    for scheme in ("three_way", "dual_pivot"):
+        assert quicksort_parallel(dups, max_workers=4, cutoff=2, scheme=scheme) == sorted(dups)
+        assert quicksort_parallel_shared(list(dups), max_workers=4, cutoff=2, scheme=scheme) == sorted(dups)
+    print("Three-way and dual-pivot schemes on duplicates: ok")
+
 
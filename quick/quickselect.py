@@ -0,0 +1,162 @@
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    from quick.quick import (INSERTION_THRESHOLD, choose_pivot, insertion_sort_range,
+                             introsort, partition_three_way)
+except ImportError:  # run as a script from inside quick/
+    from quick import (INSERTION_THRESHOLD, choose_pivot, insertion_sort_range,
+                       introsort, partition_three_way)
+
+try:
+    from common import shared
+except ImportError:  # run as a script from inside quick/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common import shared
+
+
+def _median_of_medians(arr, low, high):
+    # BFPRT pivot: medians of groups of five, gathered at the front of the
+    # range, then their median selected recursively. Returns its index.
+    if high - low + 1 <= 5:
+        insertion_sort_range(arr, low, high)
+        return (low + high) // 2
+    dest = low
+    for g in range(low, high + 1, 5):
+        g_high = min(g + 4, high)
+        insertion_sort_range(arr, g, g_high)
+        m = (g + g_high) // 2
+        arr[dest], arr[m] = arr[m], arr[dest]
+        dest += 1
+    mid = (low + dest - 1) // 2
+    _select(arr, low, dest - 1, mid, use_mom=True)
+    return mid
+
+
+def _select(arr, low, high, k, use_mom=False):
+    # Introselect: cheap pivots for 2*log2(n) rounds, then median of
+    # medians, which bounds the total work to O(n)
+    budget = 2 * (high - low + 1).bit_length()
+    while high - low + 1 > INSERTION_THRESHOLD:
+        if use_mom or budget == 0:
+            use_mom = True
+            p = _median_of_medians(arr, low, high)
+        else:
+            budget -= 1
+            p = choose_pivot(arr, low, high)
+        arr[p], arr[high] = arr[high], arr[p]
+        lt, gt = partition_three_way(arr, low, high)
+        if k < lt:
+            high = lt - 1
+        elif k > gt:
+            low = gt + 1
+        else:
+            return arr[k]
+    insertion_sort_range(arr, low, high)
+    return arr[k]
+
+
+def select_kth(arr, k, low=0, high=None):
+    # Rearrange arr[low..high] so that arr[k] holds the element of rank k
+    # (0-based), with nothing larger before it and nothing smaller after
+    if high is None:
+        high = len(arr) - 1
+    if not low <= k <= high:
+        raise IndexError(f"rank {k} outside [{low}, {high}]")
+    return _select(arr, low, high, k)
+
+
+def partial_sort(arr, k):
+    # In place: arr[:k] becomes the k smallest elements in sorted order,
+    # the rest of arr is left in unspecified order
+    n = len(arr)
+    k = min(k, n)
+    if k <= 0:
+        return arr
+    if k < n:
+        select_kth(arr, k - 1)
+    introsort(arr, 0, k - 1)
+    return arr
+
+
+def top_k(arr, k):
+    # The k smallest elements of arr, sorted; arr itself is not modified
+    return partial_sort(list(arr), k)[:max(k, 0)]
+
+
+def _select_chunk(lo, hi, k):
+    # Move the chunk's k smallest elements to the front of the chunk
+    if k < hi - lo:
+        run = shared.buf[lo:hi].tolist()
+        select_kth(run, k - 1)
+        shared.buf[lo:hi] = array("q", run)
+
+
+def partial_sort_parallel(arr, k, max_workers=None):
+    # Parallel in-place partial sort of integer keys. Each worker selects
+    # the k smallest of its chunk over a shared buffer; the parent then
+    # selects among the p * k candidates and swaps the winners to the front.
+    n = len(arr)
+    k = min(k, n)
+    if k <= 0:
+        return arr
+    max_workers = max(1, min(max_workers or os.cpu_count() or 1, n // k))
+    if max_workers == 1:
+        return partial_sort(arr, k)
+    bounds = [n * c // max_workers for c in range(max_workers + 1)]
+
+    shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    buf = shm.buf[:n * 8].cast("q")
+    try:
+        buf[:] = array("q", arr)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=shared.attach_shared, initargs=(shm.name, n)
+        ) as executor:
+            list(executor.map(_select_chunk, bounds[:-1], bounds[1:], [k] * max_workers))
+        arr[:] = buf.tolist()
+    finally:
+        buf.release()
+        shm.close()
+        shm.unlink()
+
+    # Pick the k smallest candidates, then swap them into arr[0:k]
+    candidates = [
+        (arr[i], i)
+        for lo, hi in zip(bounds, bounds[1:])
+        for i in range(lo, min(lo + k, hi))
+    ]
+    select_kth(candidates, k - 1)
+    winners = {i for _, i in candidates[:k]}
+    free = (i for i in range(k) if i not in winners)
+    for pos in sorted(winners):
+        if pos >= k:
+            slot = next(free)
+            arr[slot], arr[pos] = arr[pos], arr[slot]
+    introsort(arr, 0, k - 1)
+    return arr
+
+
+def top_k_parallel(arr, k, max_workers=None):
+    # Parallel top_k: the k smallest elements of arr, sorted
+    return partial_sort_parallel(list(arr), k, max_workers)[:max(k, 0)]
+
+
+def print_array(arr):
+    for v in arr:
+        print(v, end=" ")
+    print()
+
+
+if __name__ == "__main__":
+    data = [10, 7, 8, 9, 1, 5, 12, 4, 6, 3, 11, 2, 7, 7, 0]
+    work = list(data)
+    print("Rank 5 element:", select_kth(work, 5))
+    print("Top 4: ", end="")
+    print_array(top_k(data, 4))
+    print("Top 4 (parallel): ", end="")
+    print_array(top_k_parallel(data, 4, max_workers=2))
+    assert top_k(data, 4) == sorted(data)[:4]
+    assert top_k_parallel(data, 4, max_workers=2) == sorted(data)[:4]
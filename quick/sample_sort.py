@@ -0,0 +1,130 @@
+import os
+import random
+import sys
+from array import array
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from multiprocessing import shared_memory
+
+try:
+    from quick.quick import introsort
+except ImportError:  # run as a script from inside quick/
+    from quick import introsort
+
+try:
+    from common import shared
+except ImportError:  # run as a script from inside quick/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common import shared
+
+
+# The workers' shared buffer has 2n slots: [0, n) holds the input grouped
+# by bucket within each chunk, [n, 2n) receives the sorted buckets
+
+
+def _classify_chunk(lo, hi, splitters):
+    # One bisect per element; the chunk is rewritten grouped by bucket
+    # and only the per-bucket counts go back to the parent
+    buckets = [[] for _ in range(len(splitters) + 1)]
+    for x in shared.buf[lo:hi].tolist():
+        buckets[bisect_right(splitters, x)].append(x)
+    shared.buf[lo:hi] = array(shared.buf.format, chain.from_iterable(buckets))
+    return [len(b) for b in buckets]
+
+
+def _gather_bucket(pieces):
+    # One bucket's pieces from every chunk, concatenated into a list
+    run = []
+    for lo, hi in pieces:
+        run.extend(shared.buf[lo:hi].tolist())
+    return run
+
+
+def _bucket_pieces(bounds, counts, b):
+    # (lo, hi) of bucket b within every classified chunk: the chunk start
+    # plus the counts of the chunk's earlier buckets
+    pieces = []
+    for c, chunk_counts in enumerate(counts):
+        lo = bounds[c] + sum(chunk_counts[:b])
+        pieces.append((lo, lo + chunk_counts[b]))
+    return pieces
+
+
+def _sort_bucket(pieces, dst, scheme):
+    # Gather one bucket's pieces from every chunk, sort, write to [n + dst)
+    run = _gather_bucket(pieces)
+    introsort(run, scheme=scheme)
+    start = shared.n + dst
+    shared.buf[start:start + len(run)] = array(shared.buf.format, run)
+
+
+def choose_splitters(arr, buckets, oversample=32, seed=None):
+    # Sort a random sample of oversample * buckets keys and take every
+    # oversample-th one as a splitter
+    rng = random.Random(seed)
+    size = min(len(arr), oversample * buckets)
+    sample = sorted(rng.sample(arr, size))
+    return [sample[size * i // buckets] for i in range(1, buckets)]
+
+
+def sample_sort(arr, max_workers=None, buckets=None, oversample=32, scheme="three_way", seed=None):
+    # Parallel sample sort of integer keys, in place. Every chunk is
+    # classified into buckets in one pass in parallel, then the buckets
+    # are sorted independently in the same pool. Returns the bucket sizes
+    # and their skew (largest bucket / ideal bucket size).
+    n = len(arr)
+    max_workers = max_workers or os.cpu_count() or 1
+    buckets = buckets or max_workers
+    if n <= 1:
+        return {"bucket_sizes": [n], "skew": 1.0}
+
+    splitters = choose_splitters(arr, buckets, oversample, seed)
+    chunks = max(1, min(max_workers, n))
+    bounds = [n * c // chunks for c in range(chunks + 1)]
+
+    shm = shared_memory.SharedMemory(create=True, size=2 * n * 8)
+    buf = shm.buf[:2 * n * 8].cast("q")
+    try:
+        buf[:n] = array("q", arr)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=shared.attach_shared,
+            initargs=(shm.name, n, "q", 2 * n)
+        ) as executor:
+            counts = list(executor.map(
+                _classify_chunk, bounds[:-1], bounds[1:], [splitters] * chunks))
+
+            bucket_sizes = [sum(c[b] for c in counts) for b in range(buckets)]
+            futures = []
+            dst = 0
+            for b in range(buckets):
+                if bucket_sizes[b]:
+                    pieces = _bucket_pieces(bounds, counts, b)
+                    futures.append(executor.submit(_sort_bucket, pieces, dst, scheme))
+                dst += bucket_sizes[b]
+            for future in futures:
+                future.result()
+        arr[:] = buf[n:].tolist()
+    finally:
+        buf.release()
+        shm.close()
+        shm.unlink()
+
+    return {"bucket_sizes": bucket_sizes, "skew": max(bucket_sizes) * buckets / n}
+
+
+def print_array(arr):
+    for v in arr:
+        print(v, end=" ")
+    print()
+
+
+if __name__ == "__main__":
+    data = [10, 7, 8, 9, 1, 5, 12, 4, 6, 3, 11, 2, 7, 7, 0]
+    print("Original array: ", end="")
+    print_array(data)
+    stats = sample_sort(data, max_workers=4, oversample=4)
+    print("Sorted array: ", end="")
+    print_array(data)
+    print(f"Bucket sizes: {stats['bucket_sizes']}  skew: {stats['skew']:.2f}")
+    assert data == sorted(data)
@@ -0,0 +1,103 @@
+# Multi-minimum selection sort: every pass places the k smallest remaining
+# elements at once, found by vectorized argpartition over worker blocks
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from math import isqrt
+from multiprocessing import shared_memory
+
+import numpy as np
+
+try:
+    from common import shared
+    from common.shared import key_typecode
+except ImportError:  # run as a script from inside selection/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common import shared
+    from common.shared import key_typecode
+
+
+def block_minima(a, lo, hi, k):
+    # Indices of the k smallest elements of a[lo:hi], in no particular order
+    if hi - lo <= k:
+        return np.arange(lo, hi)
+    return np.argpartition(a[lo:hi], k - 1)[:k] + lo
+
+
+def _block_minima_shared(lo, hi, k):
+    return block_minima(np.frombuffer(shared.buf, dtype=np.int64), lo, hi, k)
+
+
+def place_minima(a, start, candidates, k):
+    # Pick the k smallest of the candidate indices and move them, sorted,
+    # to a[start:start + k]. The elements they displace from that range
+    # are moved into the slots the winners left behind.
+    order = np.lexsort((candidates, a[candidates]))[:k]
+    winners = candidates[order]
+    values = a[winners]
+    holes = winners[winners >= start + k]
+    displaced = np.setdiff1d(np.arange(start, start + k), winners, assume_unique=True)
+    a[holes] = a[displaced]
+    a[start:start + k] = values
+
+
+def block_selection_sort(arr, k=None, max_workers=None):
+    # Selection sort of integer keys that emits k sorted elements per pass
+    # (default about sqrt(n)), cutting the number of passes by a factor
+    # of k. Each pass splits the unsorted suffix into one block per worker;
+    # the workers return their blocks' k smallest indices from a shared
+    # array and the parent places the overall k smallest.
+    n = len(arr)
+    if n <= 1:
+        return arr
+    if key_typecode(arr) != "q":
+        raise TypeError("block_selection_sort needs integer keys that fit in int64")
+    k = max(1, k or isqrt(n))
+    max_workers = max(1, max_workers or os.cpu_count() or 1)
+
+    shm = shared_memory.SharedMemory(create=True, size=n * 8)
+    a = np.ndarray((n,), dtype=np.int64, buffer=shm.buf)
+    try:
+        a[:] = arr
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=shared.attach_shared, initargs=(shm.name, n)
+        ) as executor:
+            start = 0
+            while start < n:
+                step = min(k, n - start)
+                rest = n - start
+                blocks = max(1, min(max_workers, rest // step))
+                bounds = [start + rest * b // blocks for b in range(blocks + 1)]
+                if blocks == 1:
+                    candidates = block_minima(a, start, n, step)
+                else:
+                    candidates = np.concatenate(list(executor.map(
+                        _block_minima_shared, bounds[:-1], bounds[1:], [step] * blocks)))
+                place_minima(a, start, candidates, step)
+                start += step
+        arr[:] = a.tolist()
+    finally:
+        del a
+        shm.close()
+        shm.unlink()
+    return arr
+
+
+def print_array(arr):
+    for val in arr:
+        print(val, end=" ")
+    print()
+
+
+if __name__ == "__main__":
+    arr = [64, 25, 12, 22, 11, 8, 5, 3, 1, 9, 7, 4]
+
+    print("Original array: ", end="")
+    print_array(arr)
+
+    block_selection_sort(arr, k=3, max_workers=2)
+
+    print("Sorted array: ", end="")
+    print_array(arr)
+    assert arr == sorted(arr)
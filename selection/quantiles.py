@@ -0,0 +1,200 @@
+# Several order statistics at once: partition only around the requested
+# ranks and drop every range that contains none of them
+
+import os
+import random
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from math import isqrt
+from multiprocessing import shared_memory
+
+try:
+    from common.shared import attach_shared, key_typecode
+    from quick.quick import (INSERTION_THRESHOLD, choose_pivot, insertion_sort_range,
+                             partition_three_way)
+    from quick.quickselect import select_kth
+    from quick.sample_sort import _bucket_pieces, _classify_chunk, _gather_bucket
+except ImportError:  # run as a script from inside selection/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.shared import attach_shared, key_typecode
+    from quick.quick import (INSERTION_THRESHOLD, choose_pivot, insertion_sort_range,
+                             partition_three_way)
+    from quick.quickselect import select_kth
+    from quick.sample_sort import _bucket_pieces, _classify_chunk, _gather_bucket
+
+QUANTILE_METHODS = ("linear", "lower", "higher", "nearest")
+
+# Below this many elements quantiles are computed serially
+PARALLEL_CUTOFF = 1 << 16
+
+
+def multiselect(arr, ranks, low=0, high=None):
+    # Rearrange arr[low..high] so that every arr[r], r in ranks, holds the
+    # element of rank r, and return those elements in the order of ranks.
+    # A range is partitioned only if it holds a requested rank; after
+    # 2 * log2(n) bad pivots it falls back to select_kth on its middle rank.
+    if high is None:
+        high = len(arr) - 1
+    wanted = sorted(set(ranks))
+    if wanted and not (low <= wanted[0] and wanted[-1] <= high):
+        raise IndexError(f"ranks outside [{low}, {high}]")
+    budget = 2 * (high - low + 1).bit_length()
+    stack = [(low, high, wanted, budget)] if wanted else []
+    while stack:
+        lo, hi, rs, budget = stack.pop()
+        if hi - lo + 1 <= INSERTION_THRESHOLD:
+            insertion_sort_range(arr, lo, hi)
+            continue
+        if budget == 0:
+            m = len(rs) // 2
+            lt = gt = rs[m]
+            select_kth(arr, lt, lo, hi)
+        else:
+            budget -= 1
+            p = choose_pivot(arr, lo, hi)
+            arr[p], arr[hi] = arr[hi], arr[p]
+            lt, gt = partition_three_way(arr, lo, hi)
+        left = rs[:bisect_left(rs, lt)]
+        right = rs[bisect_right(rs, gt):]
+        if left:
+            stack.append((lo, lt - 1, left, budget))
+        if right:
+            stack.append((gt + 1, hi, right, budget))
+    return [arr[r] for r in ranks]
+
+
+def _quantile_ranks(n, q, method):
+    # The rank or two ranks that quantile q reads, and the interpolation weight
+    if not 0 <= q <= 1:
+        raise ValueError(f"quantile {q!r} outside [0, 1]")
+    pos = q * (n - 1)
+    lower = int(pos)
+    upper = min(lower + 1, n - 1)
+    if method == "linear" and lower < pos:
+        return lower, upper, pos - lower
+    if method == "higher" and lower < pos:
+        return upper, upper, 0.0
+    if method == "nearest":
+        return round(pos), round(pos), 0.0
+    return lower, lower, 0.0
+
+
+def _select_bucket(pieces, ranks):
+    # Gather one bucket's pieces from every chunk and select within it
+    return multiselect(_gather_bucket(pieces), ranks)
+
+
+def _splitters_around(arr, ranks, seed=None):
+    # Two splitters per rank, taken from a sorted random sample about
+    # 2 * sqrt(sample size) positions either side of the rank's estimate,
+    # so the bucket holding the rank is small with high probability
+    n = len(arr)
+    size = min(n, 64 * isqrt(n))
+    sample = sorted(random.Random(seed).sample(arr, size))
+    margin = 2 * isqrt(size) + 1
+    splitters = []
+    for r in ranks:
+        p = r * size // n
+        splitters.append(sample[max(0, p - margin)])
+        splitters.append(sample[min(size - 1, p + margin)])
+    return sorted(splitters)
+
+
+def _multiselect_parallel(arr, ranks, max_workers, typecode, seed=None):
+    # Parallel multiselect over a shared buffer of the given typecode. One
+    # parallel pass partitions every chunk into buckets bracketing the
+    # requested ranks (sample_sort's classification); buckets without a
+    # rank are dropped and the others are multiselected in the same pool.
+    n = len(arr)
+    wanted = sorted(set(ranks))
+    splitters = _splitters_around(arr, wanted, seed)
+    chunks = max(1, min(max_workers, n))
+    bounds = [n * c // chunks for c in range(chunks + 1)]
+    buckets = len(splitters) + 1
+
+    nbytes = n * array(typecode).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=nbytes)
+    buf = shm.buf[:nbytes].cast(typecode)
+    try:
+        buf[:] = array(typecode, arr)
+        with ProcessPoolExecutor(
+            max_workers=max_workers, initializer=attach_shared,
+            initargs=(shm.name, n, typecode)
+        ) as executor:
+            counts = list(executor.map(
+                _classify_chunk, bounds[:-1], bounds[1:], [splitters] * chunks))
+
+            # Bucket b covers ranks [starts[b], starts[b + 1])
+            starts = [0]
+            for b in range(buckets):
+                starts.append(starts[-1] + sum(c[b] for c in counts))
+            futures = {}
+            for b in range(buckets):
+                local = [r - starts[b] for r in wanted if starts[b] <= r < starts[b + 1]]
+                if local:
+                    pieces = _bucket_pieces(bounds, counts, b)
+                    futures[b] = (local, executor.submit(_select_bucket, pieces, local))
+
+            found = {}
+            for b, (local, future) in futures.items():
+                for r, value in zip(local, future.result()):
+                    found[r + starts[b]] = value
+    finally:
+        buf.release()
+        shm.close()
+        shm.unlink()
+    return [found[r] for r in ranks]
+
+
+def quantiles(arr, qs, method="linear", max_workers=None, seed=None):
+    # Quantiles qs (each in [0, 1]) of arr in close to linear time however
+    # many are requested; arr is not modified. method picks the value
+    # between two ranks as in NumPy: "linear" interpolation, "lower",
+    # "higher" or "nearest". Integer or float inputs of at least
+    # PARALLEL_CUTOFF elements are split across max_workers processes;
+    # other keys are handled serially.
+    n = len(arr)
+    if n == 0:
+        raise ValueError("quantiles of an empty sequence")
+    if method not in QUANTILE_METHODS:
+        raise ValueError(f"unknown method: {method!r}")
+    reads = [_quantile_ranks(n, q, method) for q in qs]
+    ranks = sorted({r for lower, upper, _ in reads for r in (lower, upper)})
+
+    max_workers = max_workers or os.cpu_count() or 1
+    typecode = key_typecode(arr) if max_workers > 1 and n >= PARALLEL_CUTOFF else None
+    if typecode:
+        values = _multiselect_parallel(arr, ranks, max_workers, typecode, seed)
+    else:
+        values = multiselect(list(arr), ranks)
+    at = dict(zip(ranks, values))
+
+    result = []
+    for lower, upper, weight in reads:
+        if weight:
+            result.append(at[lower] + (at[upper] - at[lower]) * weight)
+        else:
+            result.append(at[lower])
+    return result
+
+
+def print_array(arr):
+    for val in arr:
+        print(val, end=" ")
+    print()
+
+
+if __name__ == "__main__":
+    arr = [64, 25, 12, 22, 11, 8, 5, 3, 1, 9, 7, 4, 100, 4000, 2400]
+
+    print("Array: ", end="")
+    print_array(arr)
+
+    qs = [0.5, 0.9, 0.99]
+    print("p50 p90 p99: ", end="")
+    print_array(quantiles(arr, qs))
+    print("p50 p90 p99 (lower): ", end="")
+    print_array(quantiles(arr, qs, method="lower"))
+    assert quantiles(arr, [0, 1]) == [min(arr), max(arr)]
@@ -1,7 +1,15 @@
 # Python program for implementation of Selection
 # Sort
 
-def selection_sort(arr):
+SELECTION_MODES = ("classic", "double")
+
+def selection_sort(arr, mode="classic"):
+    if mode == "double":
+        double_selection_sort(arr)
+        return
+    if mode != "classic":
+        raise ValueError(f"unknown mode: {mode!r}")
+
     n = len(arr)
     for i in range(n - 1):
       
@@ -21,6 +29,46 @@ def selection_sort(arr):
         # correct position
         arr[i], arr[min_idx] = arr[min_idx], arr[i]
 
+# Double-ended selection sort of arr[low..high]: every pass finds both
+# the minimum and the maximum and places them at the two ends, so there
+# are half as many passes. Elements are compared in pairs: the smaller
+# of a pair against the minimum, the larger against the maximum, i.e.
+# about 3 comparisons per 2 elements instead of 4.
+def double_selection_sort(arr, low=0, high=None):
+    if high is None:
+        high = len(arr) - 1
+    while low < high:
+        if arr[low + 1] < arr[low]:
+            min_idx, max_idx = low + 1, low
+        else:
+            min_idx, max_idx = low, low + 1
+        j = low + 2
+        while j < high:
+            if arr[j + 1] < arr[j]:
+                small, large = j + 1, j
+            else:
+                small, large = j, j + 1
+            if arr[small] < arr[min_idx]:
+                min_idx = small
+            if arr[large] > arr[max_idx]:
+                max_idx = large
+            j += 2
+
+        # Odd element out at the end of the range
+        if j == high:
+            if arr[j] < arr[min_idx]:
+                min_idx = j
+            elif arr[j] > arr[max_idx]:
+                max_idx = j
+
+        arr[low], arr[min_idx] = arr[min_idx], arr[low]
+        # The maximum may just have been moved out of arr[low]
+        if max_idx == low:
+            max_idx = min_idx
+        arr[high], arr[max_idx] = arr[max_idx], arr[high]
+        low += 1
+        high -= 1
+
 def print_array(arr):
     for val in arr:
         print(val, end=" ")
@@ -35,4 +83,9 @@ if __name__ == "__main__":
     selection_sort(arr)
     
     print("Sorted array: ", end="")
+    print_array(arr)
+
+    arr = [64, 25, 12, 22, 11]
+    selection_sort(arr, mode="double")
+    print("Sorted array (double-ended): ", end="")
     print_array(arr)
\ No newline at end of file
@@ -1,49 +1,162 @@
 # parallelizes inner loop of selection sort
 
-from concurrent.futures import ProcessPoolExecutor
-
-def find_min_index(arr_slice, offset):
-    """
-    Find the index of the minimum element in the slice,
-    returning the index relative to the full array.
-    """
-    min_idx = 0
-    for i in range(1, len(arr_slice)):
-        if arr_slice[i] < arr_slice[min_idx]:
-            min_idx = i
-    return min_idx + offset
-
-def selection_sort_parallel(arr):
-    n = len(arr)
-    for i in range(n - 1):
-        # Parallel part: find the min index from i to n-1
-        with ProcessPoolExecutor() as executor:
-            # Only split if large enough to benefit
-            if n - i > 1000:
-                # Divide the remaining unsorted part into chunks
-                num_chunks = 4
-                chunk_size = (n - i) // num_chunks
-                futures = []
-                for c in range(num_chunks):
-                    start = i + c * chunk_size
-                    end = i + (c + 1) * chunk_size if c != num_chunks - 1 else n
-                    futures.append(executor.submit(find_min_index, arr[start:end], start))
-
-                # Get min index from among the chunks
-                min_idx = i
-                for future in futures:
-                    idx = future.result()
-                    if arr[idx] < arr[min_idx]:
-                        min_idx = idx
+import multiprocessing
+import os
+import sys
+import threading
+from array import array
+from multiprocessing import shared_memory
+
+try:
+    from selection.selection import SELECTION_MODES, double_selection_sort
+except ImportError:  # run as a script from inside selection/
+    from selection import SELECTION_MODES, double_selection_sort
+
+try:
+    from common.shared import join_workers, key_typecode
+except ImportError:  # run as a script from inside selection/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common.shared import join_workers, key_typecode
+
+# Below this many unsorted elements the rest is finished serially
+SERIAL_CUTOFF = 1000
+
+
+def _min_worker(name, n, workers, w, double, barrier):
+    # Persistent worker. Per round it reads only the bounds of the unsorted
+    # range from the control slots, scans its share of arr[lo:hi] in the
+    # shared buffer and writes back its (value, index) minimum, plus its
+    # maximum if double. A negative lo stops it.
+    shm = shared_memory.SharedMemory(name=name)
+    view = shm.buf[:(n + 4 * workers + 2) * 8].cast("q")
+    try:
+        result = n + 4 * w
+        control = n + 4 * workers
+        while True:
+            barrier.wait()
+            lo = view[control]
+            if lo < 0:
+                break
+            hi = view[control + 1]
+            first = lo + (hi - lo) * w // workers
+            last = lo + (hi - lo) * (w + 1) // workers
+            if first < last:
+                values = view[first:last].tolist()
+                value = min(values)
+                view[result] = value
+                view[result + 1] = first + values.index(value)
+                if double:
+                    value = max(values)
+                    view[result + 2] = value
+                    view[result + 3] = first + values.index(value)
             else:
-                # Fallback to sequential for small segments
-                min_idx = i
-                for j in range(i + 1, n):
-                    if arr[j] < arr[min_idx]:
-                        min_idx = j
+                view[result + 1] = -1
+            barrier.wait()
+    finally:
+        view.release()
+        shm.close()
+
+
+def selection_sort_parallel(arr, max_workers=4, mode="classic"):
+    # Selection sort of integer keys whose minimum search is split across
+    # persistent workers attached to a shared-memory array. Each round the
+    # parent broadcasts the unsorted range and gathers one (value, index)
+    # minimum per worker; two barrier waits per round, no pickled slices.
+    # mode="double" also gathers maxima and fills both ends each round.
+    # Keys that are not int64 integers are sorted serially.
+    if mode not in SELECTION_MODES:
+        raise ValueError(f"unknown mode: {mode!r}")
+    double = mode == "double"
+    n = len(arr)
+    workers = max(1, max_workers)
+    lo, hi = 0, n
+    if n - 1 <= SERIAL_CUTOFF or workers == 1 or key_typecode(arr) != "q":
+        _finish_serial(arr, lo, hi, double)
+        return arr
+
+    size = (n + 4 * workers + 2) * 8
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    view = shm.buf[:size].cast("q")
+    control = n + 4 * workers
+    procs = []
+    try:
+        view[:n] = array("q", arr)
+        barrier = multiprocessing.Barrier(workers + 1)
+        procs = [
+            multiprocessing.Process(
+                target=_min_worker, args=(shm.name, n, workers, w, double, barrier))
+            for w in range(workers)
+        ]
+        for p in procs:
+            p.start()
+        watcher = threading.Thread(target=join_workers, args=(procs, barrier), daemon=True)
+        watcher.start()
 
+        while hi - lo > SERIAL_CUTOFF:
+            view[control] = lo
+            view[control + 1] = hi
+            try:
+                barrier.wait()
+                barrier.wait()
+            except threading.BrokenBarrierError:
+                raise RuntimeError("selection worker failed") from None
+
+            # Earliest index on ties (as in selection_sort)
+            min_idx = max_idx = lo
+            for w in range(workers):
+                result = n + 4 * w
+                if view[result + 1] < 0:
+                    continue
+                if view[result] < view[min_idx]:
+                    min_idx = view[result + 1]
+                if double and view[result + 2] > view[max_idx]:
+                    max_idx = view[result + 3]
+            view[lo], view[min_idx] = view[min_idx], view[lo]
+            if double:
+                # The maximum may just have been moved out of view[lo]
+                if max_idx == lo:
+                    max_idx = min_idx
+                hi -= 1
+                view[hi], view[max_idx] = view[max_idx], view[hi]
+            lo += 1
+
+        view[control] = -1
+        barrier.wait()
+        watcher.join()
+        if any(p.exitcode != 0 for p in procs):
+            raise RuntimeError("selection worker failed")
+        arr[:] = view[:n].tolist()
+    finally:
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+        view.release()
+        shm.close()
+        shm.unlink()
+
+    _finish_serial(arr, lo, hi, double)
+    return arr
+
+
+def _finish_serial(arr, lo, hi, double):
+    # Serial selection sort of the unsorted range arr[lo:hi]
+    if double:
+        double_selection_sort(arr, lo, hi - 1)
+    else:
+        _selection_sort_serial(arr, lo)
+
+
+def _selection_sort_serial(arr, start):
+    # Plain selection sort of arr[start:]
+    n = len(arr)
+    for i in range(start, n - 1):
+        min_idx = i
+        for j in range(i + 1, n):
+            if arr[j] < arr[min_idx]:
+                min_idx = j
         arr[i], arr[min_idx] = arr[min_idx], arr[i]
 
+
 def print_array(arr):
     for val in arr:
         print(val, end=" ")
@@ -1,6 +1,5 @@
 # Python program for parallel implementation of Selection Sort
-import concurrent.futures
-from typing import List
+from typing import List, Optional
 
 def selection_sort_sequential(arr: List[int], start: int, end: int) -> None:
     """Sequential selection sort for a subarray"""
@@ -13,8 +12,14 @@ def selection_sort_sequential(arr: List[int], start: int, end: int) -> None:
         
         arr[i], arr[min_idx] = arr[min_idx], arr[i]
 
-def parallel_selection_sort(arr: List[int], start: int = 0, end: int = None) -> None:
-    """Parallel selection sort using divide and conquer approach"""
+def parallel_selection_sort(arr: List[int], start: int = 0, end: int = None,
+                            k: Optional[int] = None, workers: Optional[int] = None) -> None:
+    """Parallel selection sort of arr[start..end].
+
+    Each pass places the k smallest remaining elements, found by the
+    workers' vectorized argpartition over their blocks (see
+    block_selection.py). Without NumPy it falls back to the sequential sort.
+    """
     if end is None:
         end = len(arr) - 1
     
@@ -25,29 +30,22 @@ def parallel_selection_sort(arr: List[int], start: int = 0, end: int = None) ->
     if end - start < 50:
         selection_sort_sequential(arr, start, end)
         return
-    
-    # Find minimum element in the range
-    min_idx = start
-    for i in range(start + 1, end + 1):
-        if arr[i] < arr[min_idx]:
-            min_idx = i
-    
-    # Swap minimum with first element
-    arr[start], arr[min_idx] = arr[min_idx], arr[start]
-    
-    # Recursively sort the rest in parallel
-    if start + 1 < end:
-        # Divide the remaining array into two parts
-        mid = start + 1 + (end - start - 1) // 2
-        
-        # Sort both parts in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-            future1 = executor.submit(parallel_selection_sort, arr, start + 1, mid)
-            future2 = executor.submit(parallel_selection_sort, arr, mid + 1, end)
-            
-            # Wait for both parts to complete
-            future1.result()
-            future2.result()
+
+    try:
+        try:
+            from selection.block_selection import block_selection_sort, key_typecode
+        except ImportError:  # run as a script from inside selection/
+            from block_selection import block_selection_sort, key_typecode
+    except ImportError:  # NumPy is not installed
+        selection_sort_sequential(arr, start, end)
+        return
+
+    run = arr[start:end + 1]
+    if key_typecode(run) != "q":
+        selection_sort_sequential(arr, start, end)
+        return
+    block_selection_sort(run, k, workers)
+    arr[start:end + 1] = run
 
 def print_array(arr: List[int]) -> None:
     """Print array elements"""
@@ -0,0 +1,167 @@
+# Tournament (winner tree) selection: every minimum after the first costs
+# one replay of the previous winner's leaf-to-root path, O(log n)
+
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+try:
+    from common import shared
+    from common.shared import key_typecode
+except ImportError:  # run as a script from inside selection/
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from common import shared
+    from common.shared import key_typecode
+
+# Below this many elements the tree is built serially
+PARALLEL_CUTOFF = 1 << 14
+
+
+def _build_subtree(values, leaves):
+    # Heap-ordered winner tree over leaves (a power of two of indices into
+    # values, -1 for padding). Node j holds the index of the smaller of its
+    # children's winners; ties go to the left child, i.e. the lower index.
+    m = len(leaves)
+    tree = [0] * m + leaves
+    for j in range(m - 1, 0, -1):
+        a = tree[2 * j]
+        b = tree[2 * j + 1]
+        tree[j] = a if b < 0 or (a >= 0 and not values[b] < values[a]) else b
+    return tree
+
+
+# The parallel build's shared buffer holds the n values, then the
+# 2 * size tree
+
+
+def _build_part(root, size, parts):
+    # Build the subtree under node root (one of parts equal subtrees) from
+    # its slice of values and write its nodes back level by level
+    n = shared.n
+    m = size // parts
+    lo = (root - parts) * m
+    values = shared.buf[lo:min(lo + m, n)].tolist()
+    leaves = list(range(len(values))) + [-1] * (m - len(values))
+    sub = _build_subtree(values, leaves)
+    tree = n
+    level = 1
+    while level < m:
+        first = root * level
+        shared.buf[tree + first:tree + first + level] = array(
+            "q", (i + lo if i >= 0 else -1 for i in sub[level:2 * level]))
+        level *= 2
+
+
+class TournamentTree:
+    # Winner tree over a fixed list of values. pop() returns the next
+    # smallest value; iterating yields the remaining values in sorted
+    # order, lazily. With max_workers > 1 a tree over int64 keys is built
+    # in parallel: one subtree per worker, the top levels in the parent.
+    # Other keys always get the serial build.
+
+    def __init__(self, values, max_workers=1):
+        self.values = list(values)
+        n = len(self.values)
+        self.size = 1 << max(0, (n - 1).bit_length())
+        self.remaining = n
+        if max_workers > 1 and n >= PARALLEL_CUTOFF and key_typecode(self.values) == "q":
+            self.tree = self._build_parallel(max_workers)
+        else:
+            leaves = list(range(n)) + [-1] * (self.size - n)
+            self.tree = _build_subtree(self.values, leaves)
+
+    def _build_parallel(self, max_workers):
+        n, size = len(self.values), self.size
+        parts = 1 << (min(max_workers, size).bit_length() - 1)
+
+        total = (n + 2 * size) * 8
+        shm = shared_memory.SharedMemory(create=True, size=total)
+        buf = shm.buf[:total].cast("q")
+        try:
+            buf[:n] = array("q", self.values)
+            with ProcessPoolExecutor(
+                max_workers=parts, initializer=shared.attach_shared,
+                initargs=(shm.name, n, "q", n + 2 * size)
+            ) as executor:
+                list(executor.map(_build_part, range(parts, 2 * parts), [size] * parts, [parts] * parts))
+            tree = buf[n:n + size].tolist()
+        finally:
+            buf.release()
+            shm.close()
+            shm.unlink()
+
+        # Leaves, then the top levels above the subtree roots
+        tree += list(range(n)) + [-1] * (size - n)
+        values = self.values
+        for j in range(parts - 1, 0, -1):
+            a = tree[2 * j]
+            b = tree[2 * j + 1]
+            tree[j] = a if b < 0 or (a >= 0 and not values[b] < values[a]) else b
+        return tree
+
+    def __len__(self):
+        return self.remaining
+
+    def peek(self):
+        # Smallest remaining value, without removing it
+        if not self.remaining:
+            raise IndexError("peek from an empty tournament")
+        return self.values[self.tree[1]]
+
+    def pop(self):
+        # Remove and return the smallest remaining value. Its leaf is
+        # retired and only the matches on its path are replayed.
+        if not self.remaining:
+            raise IndexError("pop from an empty tournament")
+        tree, values = self.tree, self.values
+        w = tree[1]
+        self.remaining -= 1
+        node = self.size + w
+        tree[node] = -1
+        node >>= 1
+        while node:
+            a = tree[2 * node]
+            b = tree[2 * node + 1]
+            tree[node] = a if b < 0 or (a >= 0 and not values[b] < values[a]) else b
+            node >>= 1
+        return values[w]
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if not self.remaining:
+            raise StopIteration
+        return self.pop()
+
+
+def tournament_sort(arr, max_workers=1):
+    # Sort arr in place by draining a TournamentTree; stable
+    if len(arr) > 1:
+        arr[:] = list(TournamentTree(arr, max_workers))
+    return arr
+
+
+def print_array(arr):
+    for val in arr:
+        print(val, end=" ")
+    print()
+
+
+if __name__ == "__main__":
+    arr = [64, 25, 12, 22, 11, 100, 4000, 2400]
+
+    print("Original array: ", end="")
+    print_array(arr)
+
+    tournament_sort(arr)
+
+    print("Sorted array: ", end="")
+    print_array(arr)
+    assert arr == sorted(arr)
+
+    stream = TournamentTree([64, 25, 12, 22, 11, 100, 4000, 2400])
+    print("Three smallest: ", end="")
+    print_array([next(stream) for _ in range(3)])